@@ -15,11 +15,62 @@
 #     You should have received a copy of the GNU Affero General Public
 #     License along with Ready Trader Go.  If not, see
 #     <https://www.gnu.org/licenses/>.
+from typing import List, Tuple
+
 from .types import Instrument, Side
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; the kernels below work unchanged without it.
+    njit = None
+
+# Transaction deltas indexed by side (Side.SELL is 0 and Side.BUY is 1) so
+# that the per-fill hot path avoids branching on the side of the trade.
+BALANCE_SIGNS = (1, -1)
+POSITION_SIGNS = (-1, 1)
+
+_round = round
+
+# Fixed-point representation used for the ETF clamp ratio: 32 fractional bits
+# is exact to well beyond the six decimal places used in configurations.
+_CLAMP_SHIFT = 32
+_CLAMP_HALF = 1 << (_CLAMP_SHIFT - 1)
+
+
+def _transact_kernel(side: int, price: float, volume: int, fee: int) -> int:
+    """Return the account balance delta for the specified fill."""
+    return BALANCE_SIGNS[side] * int(_round(price * volume)) - fee
+
+
+def _update_kernel(balance: int, future_position: int, etf_position: int, clamp_num: int, tick_size: int,
+                   future_price: int, etf_price: int, max_profit: int, max_drawdown: int) -> Tuple[int, int, int]:
+    """Return the new profit, maximum profit and maximum drawdown for an account."""
+    delta: int = (future_price * clamp_num + _CLAMP_HALF) >> _CLAMP_SHIFT
+    delta -= delta % tick_size
+    min_price: int = future_price - delta
+    max_price: int = future_price + delta
+    clamped: int = min_price if etf_price < min_price else max_price if etf_price > max_price else etf_price
+    profit: int = balance + future_position * future_price + etf_position * clamped
+    if profit > max_profit:
+        max_profit = profit
+    if max_profit - profit > max_drawdown:
+        max_drawdown = max_profit - profit
+    return profit, max_profit, max_drawdown
+
+
+if njit is not None:
+    _transact_kernel = njit(cache=True)(_transact_kernel)
+    _update_kernel = njit(cache=True)(_update_kernel)
+    # Warm the compilation cache at import time rather than on the first fill.
+    _transact_kernel(0, 0.0, 0, 0)
+    _update_kernel(0, 0, 0, 0, 1, 0, 0, 0, 0)
+
 
 class CompetitorAccount(object):
     """A competitors account."""
+    __slots__ = ("account_balance", "buy_volume", "etf_clamp", "etf_position", "future_position", "max_drawdown",
+                 "max_profit", "profit_or_loss", "sell_volume", "tick_size", "total_fees", "_clamp_num")
 
     def __init__(self, tick_size: float, etf_clamp: float):
         """Initialise a new instance of the CompetitorAccount class."""
@@ -34,42 +85,60 @@ class CompetitorAccount(object):
         self.sell_volume: int = 0
         self.tick_size: int = int(tick_size * 100.0)
         self.total_fees: int = 0
+        self._clamp_num: int = int(_round(etf_clamp * (1 << _CLAMP_SHIFT)))
 
     def transact(self, instrument: Instrument, side: Side, price: float, volume: int, fee: int) -> None:
         """Update this account with the specified transaction."""
-        if side == Side.SELL:
-            self.account_balance += round(price * volume)
+        if type(price) is int:
+            # Prices from the matching engine are already integer cents, so
+            # the traded value is exact and no rounding is required.
+            self.account_balance += BALANCE_SIGNS[side] * price * volume - fee
         else:
-            self.account_balance -= round(price * volume)
-
-        self.account_balance -= fee
+            # Pass the side as a plain int so the jitted kernel only ever
+            # compiles the primitive signature warmed at import.
+            self.account_balance += _transact_kernel(int(side), price, volume, fee)
         self.total_fees += fee
 
         if instrument == Instrument.FUTURE:
-            if side == Side.SELL:
-                self.future_position -= volume
-            else:
-                self.future_position += volume
+            self.future_position += POSITION_SIGNS[side] * volume
         else:
             if side == Side.SELL:
                 self.sell_volume += volume
-                self.etf_position -= volume
             else:
                 self.buy_volume += volume
-                self.etf_position += volume
+            self.etf_position += POSITION_SIGNS[side] * volume
 
     def update(self, future_price: int, etf_price: int) -> None:
         """Update this account using the specified prices."""
-        delta: int = round(self.etf_clamp * future_price)
-        delta -= delta % self.tick_size
-        min_price: int = future_price - delta
-        max_price: int = future_price + delta
-        clamped: int = min_price if etf_price < min_price else max_price if etf_price > max_price else etf_price
-        self.profit_or_loss = self.account_balance + self.future_position * future_price + self.etf_position * clamped
-        if self.profit_or_loss > self.max_profit:
-            self.max_profit = self.profit_or_loss
-        if self.max_profit - self.profit_or_loss > self.max_drawdown:
-            self.max_drawdown = self.max_profit - self.profit_or_loss
+        self.profit_or_loss, self.max_profit, self.max_drawdown = _update_kernel(
+            self.account_balance, self.future_position, self.etf_position, self._clamp_num, self.tick_size,
+            future_price, etf_price, self.max_profit, self.max_drawdown)
+
+
+def update_all(accounts: List[CompetitorAccount], future_price: int, etf_price: int) -> None:
+    """Update all of the specified accounts using the specified prices.
+
+    The accounts must share the same ETF clamp and tick size (i.e. they must
+    all have come from the same factory) so that the clamped ETF price can be
+    computed once rather than once per account.
+    """
+    if not accounts:
+        return
+
+    first: CompetitorAccount = accounts[0]
+    delta: int = (future_price * first._clamp_num + _CLAMP_HALF) >> _CLAMP_SHIFT
+    delta -= delta % first.tick_size
+    min_price: int = future_price - delta
+    max_price: int = future_price + delta
+    clamped: int = min_price if etf_price < min_price else max_price if etf_price > max_price else etf_price
+
+    for account in accounts:
+        profit = account.profit_or_loss = (account.account_balance + account.future_position * future_price
+                                           + account.etf_position * clamped)
+        if profit > account.max_profit:
+            account.max_profit = profit
+        if account.max_profit - profit > account.max_drawdown:
+            account.max_drawdown = account.max_profit - profit
 
 
 class AccountFactory:
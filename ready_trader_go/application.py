@@ -18,16 +18,58 @@
 import asyncio
 import json
 import logging
+import logging.handlers
 import pathlib
+import queue
 import signal
 import sys
 
 from typing import Callable, Optional
 
+try:
+    # uvloop is optional: when installed its C event loop implementation
+    # replaces the default asyncio loop for all applications.
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+
+_SIGNAL_NAMES = {int(signal.SIGINT): "SIGINT", int(signal.SIGTERM): "SIGTERM"}
+
 
 class Application(object):
     """Standard application setup."""
 
+    __log_listener: Optional[logging.handlers.QueueListener] = None
+
+    @classmethod
+    def configure_logging(cls, name: str) -> None:
+        """Configure process-wide logging; calls after the first are no-ops.
+
+        Log records are queued and written to the file from a separate
+        thread so that disk writes happen off the event loop, and the log
+        file itself is opened lazily on the first record.
+        """
+        if Application.__log_listener is not None:
+            return
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        file_handler = logging.FileHandler(name + ".log", delay=True)
+        file_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)-7s] [%(name)s] %(message)s"))
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter("%(message)s"))
+        logging.basicConfig(handlers=[queue_handler], level=logging.INFO)
+        Application.__log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+        Application.__log_listener.start()
+
+    @classmethod
+    def _stop_logging(cls) -> None:
+        """Flush any queued log records and stop the listener thread."""
+        if Application.__log_listener is not None:
+            Application.__log_listener.stop()
+            Application.__log_listener = None
+
     def __init__(self, name: str, config_validator: Optional[Callable] = None):
         """Initialise a new instance of the Application class."""
         self.event_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
@@ -44,8 +86,7 @@ class Application(object):
             # Signal handlers are only implemented on Unix
             pass
 
-        logging.basicConfig(filename=name + ".log", format="%(asctime)s [%(levelname)-7s] [%(name)s] %(message)s",
-                            level=logging.INFO)
+        self.configure_logging(name)
 
         self.config = None
         config_path = pathlib.Path(name + ".json")
@@ -58,12 +99,12 @@ class Application(object):
             raise Exception("configuration file does not exist: %s" % str(config_path))
 
         self.logger.info("%s started with arguments={%s}", self.name, ", ".join(sys.argv))
-        if self.config is not None:
+        if self.config is not None and self.logger.isEnabledFor(logging.INFO):
             self.logger.info("configuration=%s", json.dumps(self.config, separators=(',', ':')))
 
     def on_signal(self, signum: int) -> None:
         """Called when a signal is received."""
-        sig_name = "SIGINT" if signum == signal.SIGINT else "SIGTERM"
+        sig_name = _SIGNAL_NAMES.get(signum, str(signum))
         self.logger.info("%s signal received - shutting down...", sig_name)
         self.event_loop.stop()
 
@@ -82,3 +123,4 @@ class Application(object):
                 loop.run_until_complete(loop.shutdown_asyncgens())
             finally:
                 loop.close()
+                self._stop_logging()
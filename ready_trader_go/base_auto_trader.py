@@ -23,14 +23,19 @@ from typing import List, Optional
 from .messages import (AMEND_MESSAGE, AMEND_MESSAGE_SIZE, CANCEL_MESSAGE, CANCEL_MESSAGE_SIZE,
                        ERROR_MESSAGE, ERROR_MESSAGE_SIZE, HEDGE_MESSAGE, HEDGE_MESSAGE_SIZE,
                        HEDGE_FILLED_MESSAGE, HEDGE_FILLED_MESSAGE_SIZE, INSERT_MESSAGE, INSERT_MESSAGE_SIZE,
-                       LOGIN_MESSAGE, LOGIN_MESSAGE_SIZE, ORDER_BOOK_HEADER, ORDER_BOOK_HEADER_SIZE,
-                       ORDER_BOOK_MESSAGE_SIZE, BOOK_PART, ORDER_FILLED_MESSAGE, ORDER_FILLED_MESSAGE_SIZE,
-                       ORDER_STATUS_MESSAGE, ORDER_STATUS_MESSAGE_SIZE, TRADE_TICKS_HEADER,
-                       TRADE_TICKS_HEADER_SIZE, TRADE_TICKS_MESSAGE_SIZE, TICKS_PART,
+                       LOGIN_MESSAGE, LOGIN_MESSAGE_SIZE, ORDER_BOOK_FULL_MESSAGE, ORDER_BOOK_MESSAGE_SIZE,
+                       ORDER_FILLED_MESSAGE, ORDER_FILLED_MESSAGE_SIZE, ORDER_STATUS_MESSAGE,
+                       ORDER_STATUS_MESSAGE_SIZE, TRADE_TICKS_FULL_MESSAGE, TRADE_TICKS_MESSAGE_SIZE,
                        Connection, MessageType, Subscription)
+from .order_book import TOP_LEVEL_COUNT
 from .types import Lifespan, Side
 
 
+# Slices of a decoded information message holding each price/volume vector
+_ASK_PRICES, _ASK_VOLUMES, _BID_PRICES, _BID_VOLUMES = (
+    slice(2 + i * TOP_LEVEL_COUNT, 2 + (i + 1) * TOP_LEVEL_COUNT) for i in range(4))
+
+
 class BaseAutoTrader(Connection, Subscription):
     """Base class for an auto-trader."""
 
@@ -41,38 +46,117 @@ class BaseAutoTrader(Connection, Subscription):
 
         self.event_loop: asyncio.AbstractEventLoop = loop
         self.logger = logging.getLogger("TRADER")
+        self._log_error = self.logger.error
         self.team_name: bytes = team_name.encode()
         self.secret: bytes = secret.encode()
 
-    def connection_made(self, transport: asyncio.BaseTransport) -> None:
-        """Called twice, when the execution connection and the information channel are established."""
-        if transport.get_extra_info("peername") is not None:
-            Connection.connection_made(self, transport)
-            self.send_message(MessageType.LOGIN, LOGIN_MESSAGE.pack(self.team_name, self.secret), LOGIN_MESSAGE_SIZE)
-        else:
-            Subscription.connection_made(self, transport)
+        # Pre-bound message types, pack methods and sizes for the send fast
+        # paths, so each send avoids repeated global and attribute lookups
+        self._send = self.send_message
+        self._amend_type = MessageType.AMEND_ORDER
+        self._amend_pack = AMEND_MESSAGE.pack
+        self._amend_size = AMEND_MESSAGE_SIZE
+        self._cancel_type = MessageType.CANCEL_ORDER
+        self._cancel_pack = CANCEL_MESSAGE.pack
+        self._cancel_size = CANCEL_MESSAGE_SIZE
+        self._hedge_type = MessageType.HEDGE_ORDER
+        self._hedge_pack = HEDGE_MESSAGE.pack
+        self._hedge_size = HEDGE_MESSAGE_SIZE
+        self._insert_type = MessageType.INSERT_ORDER
+        self._insert_pack = INSERT_MESSAGE.pack
+        self._insert_size = INSERT_MESSAGE_SIZE
 
-    def connection_lost(self, exc: Optional[Exception]) -> None:
+        # Reusable price and volume lists passed to the information message
+        # handlers; they are overwritten in place for each message so that
+        # decoding does not allocate four new lists per message
+        self._ask_prices: List[int] = [0] * TOP_LEVEL_COUNT
+        self._ask_volumes: List[int] = [0] * TOP_LEVEL_COUNT
+        self._bid_prices: List[int] = [0] * TOP_LEVEL_COUNT
+        self._bid_volumes: List[int] = [0] * TOP_LEVEL_COUNT
+
+    def execution_protocol(self) -> asyncio.BufferedProtocol:
+        """Return a protocol for the execution channel of this auto-trader."""
+        return _ExecutionProtocol(self)
+
+    def information_protocol(self) -> asyncio.DatagramProtocol:
+        """Return a protocol for the information channel of this auto-trader."""
+        return _InformationProtocol(self)
+
+    def on_execution_connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Called when the execution connection is established."""
+        Connection.connection_made(self, transport)
+        self.send_message(MessageType.LOGIN, LOGIN_MESSAGE.pack(self.team_name, self.secret), LOGIN_MESSAGE_SIZE)
+
+    def on_execution_connection_lost(self, exc: Optional[Exception]) -> None:
         """Called when the connection is lost on the execution channel."""
-        if self._connection_transport is not None and self._connection_transport.is_closing():
-            Connection.connection_lost(self, exc)
-            Subscription.close(self)
-        else:
-            Subscription.connection_lost(self, exc)
-            Connection.close(self)
+        Connection.connection_lost(self, exc)
+        Subscription.close(self)
+        self.event_loop.stop()
+
+    def on_information_connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Called when the information channel is established."""
+        Subscription.connection_made(self, transport)
+
+    def on_information_connection_lost(self, exc: Optional[Exception]) -> None:
+        """Called when the information channel is lost."""
+        Subscription.connection_lost(self, exc)
+        Connection.close(self)
         self.event_loop.stop()
 
+    def _decode_error(self, data: bytes, start: int) -> None:
+        client_order_id, error_message = ERROR_MESSAGE.unpack_from(data, start)
+        self.on_error_message(client_order_id, error_message.rstrip(b"\x00"))
+
+    def _decode_hedge_filled(self, data: bytes, start: int) -> None:
+        self.on_hedge_filled_message(*HEDGE_FILLED_MESSAGE.unpack_from(data, start))
+
+    def _decode_order_book_update(self, data: bytes, start: int) -> None:
+        values = ORDER_BOOK_FULL_MESSAGE.unpack_from(data, start)
+        ask_prices, ask_volumes = self._ask_prices, self._ask_volumes
+        bid_prices, bid_volumes = self._bid_prices, self._bid_volumes
+        ask_prices[:] = values[_ASK_PRICES]
+        ask_volumes[:] = values[_ASK_VOLUMES]
+        bid_prices[:] = values[_BID_PRICES]
+        bid_volumes[:] = values[_BID_VOLUMES]
+        self.on_order_book_update_message(values[0], values[1], ask_prices, ask_volumes, bid_prices, bid_volumes)
+
+    def _decode_order_filled(self, data: bytes, start: int) -> None:
+        self.on_order_filled_message(*ORDER_FILLED_MESSAGE.unpack_from(data, start))
+
+    def _decode_order_status(self, data: bytes, start: int) -> None:
+        self.on_order_status_message(*ORDER_STATUS_MESSAGE.unpack_from(data, start))
+
+    def _decode_trade_ticks(self, data: bytes, start: int) -> None:
+        values = TRADE_TICKS_FULL_MESSAGE.unpack_from(data, start)
+        ask_prices, ask_volumes = self._ask_prices, self._ask_volumes
+        bid_prices, bid_volumes = self._bid_prices, self._bid_volumes
+        ask_prices[:] = values[_ASK_PRICES]
+        ask_volumes[:] = values[_ASK_VOLUMES]
+        bid_prices[:] = values[_BID_PRICES]
+        bid_volumes[:] = values[_BID_VOLUMES]
+        self.on_trade_ticks_message(values[0], values[1], ask_prices, ask_volumes, bid_prices, bid_volumes)
+
+    # Dispatch tables mapping message type to expected size and decoder,
+    # shared by all instances and built once at class-definition time
+    _EXEC_DISPATCH = {
+        MessageType.ERROR: (ERROR_MESSAGE_SIZE, _decode_error),
+        MessageType.HEDGE_FILLED: (HEDGE_FILLED_MESSAGE_SIZE, _decode_hedge_filled),
+        MessageType.ORDER_FILLED: (ORDER_FILLED_MESSAGE_SIZE, _decode_order_filled),
+        MessageType.ORDER_STATUS: (ORDER_STATUS_MESSAGE_SIZE, _decode_order_status),
+    }
+    _INFO_DISPATCH = {
+        MessageType.ORDER_BOOK_UPDATE: (ORDER_BOOK_MESSAGE_SIZE, _decode_order_book_update),
+        MessageType.TRADE_TICKS: (TRADE_TICKS_MESSAGE_SIZE, _decode_trade_ticks),
+    }
+
     def on_datagram(self, typ: int, data: bytes, start: int, length: int) -> None:
         """Called when an information message is received from the matching engine."""
-        if typ == MessageType.ORDER_BOOK_UPDATE and length == ORDER_BOOK_MESSAGE_SIZE:
-            inst, seq = ORDER_BOOK_HEADER.unpack_from(data, start)
-            self.on_order_book_update_message(inst, seq, *BOOK_PART.iter_unpack(data[ORDER_BOOK_HEADER_SIZE:]))
-        elif typ == MessageType.TRADE_TICKS and length == TRADE_TICKS_MESSAGE_SIZE:
-            inst, seq = TRADE_TICKS_HEADER.unpack_from(data, start)
-            self.on_trade_ticks_message(inst, seq, *TICKS_PART.iter_unpack(data[TRADE_TICKS_HEADER_SIZE:]))
-        else:
-            self.logger.error("received invalid information message: length=%d type=%d", length, typ)
+        entry = self._INFO_DISPATCH.get(typ)
+        if entry is None or length != entry[0]:
+            self._log_error("received invalid information message: length=%d type=%d", length, typ)
             self.event_loop.stop()
+        else:
+            entry[1](self, data, start)
 
     def on_hedge_filled_message(self, client_order_id: int, price: int, volume: int) -> None:
         """Called when one of your hedge orders is filled, partially or fully.
@@ -86,18 +170,12 @@ class BaseAutoTrader(Connection, Subscription):
 
     def on_message(self, typ: int, data: bytes, start: int, length: int) -> None:
         """Called when an execution message is received from the matching engine."""
-        if typ == MessageType.ERROR and length == ERROR_MESSAGE_SIZE:
-            client_order_id, error_message = ERROR_MESSAGE.unpack_from(data, start)
-            self.on_error_message(client_order_id, error_message.rstrip(b"\x00"))
-        elif typ == MessageType.HEDGE_FILLED and length == HEDGE_FILLED_MESSAGE_SIZE:
-            self.on_hedge_filled_message(*HEDGE_FILLED_MESSAGE.unpack_from(data, start))
-        elif typ == MessageType.ORDER_FILLED and length == ORDER_FILLED_MESSAGE_SIZE:
-            self.on_order_filled_message(*ORDER_FILLED_MESSAGE.unpack_from(data, start))
-        elif typ == MessageType.ORDER_STATUS and length == ORDER_STATUS_MESSAGE_SIZE:
-            self.on_order_status_message(*ORDER_STATUS_MESSAGE.unpack_from(data, start))
-        else:
-            self.logger.error("received invalid execution message: length=%d type=%d", length, typ)
+        entry = self._EXEC_DISPATCH.get(typ)
+        if entry is None or length != entry[0]:
+            self._log_error("received invalid execution message: length=%d type=%d", length, typ)
             self.event_loop.stop()
+        else:
+            entry[1](self, data, start)
 
     def on_error_message(self, client_order_id: int, error_message: bytes):
         """Called when the matching engine detects an error."""
@@ -112,6 +190,9 @@ class BaseAutoTrader(Connection, Subscription):
         there are less than five prices on a side, then zeros will appear at
         the end of both the prices and volumes lists on that side so that
         there are always five entries in each list.
+
+        The lists are reused between messages, so take a copy of any you
+        wish to keep.
         """
 
     def on_order_filled_message(self, client_order_id: int, price: int, volume: int) -> None:
@@ -142,6 +223,9 @@ class BaseAutoTrader(Connection, Subscription):
         each of those price levels. If there are less than five prices on a
         side, then zeros will appear at the end of both the prices and volumes
         lists on that side so that there are always five entries in each list.
+
+        The lists are reused between messages, so take a copy of any you
+        wish to keep.
         """
 
     def send_amend_order(self, client_order_id: int, volume: int) -> None:
@@ -152,7 +236,7 @@ class BaseAutoTrader(Connection, Subscription):
         cancelled this request has no effect and no order status message will
         be received.
         """
-        self.send_message(MessageType.AMEND_ORDER, AMEND_MESSAGE.pack(client_order_id, volume), AMEND_MESSAGE_SIZE)
+        self._send(self._amend_type, self._amend_pack(client_order_id, volume), self._amend_size)
 
     def send_cancel_order(self, client_order_id: int) -> None:
         """Cancel the specified order.
@@ -160,16 +244,50 @@ class BaseAutoTrader(Connection, Subscription):
         If the order has already completely filled or been cancelled this
         request has no effect and no order status message will be received.
         """
-        self.send_message(MessageType.CANCEL_ORDER, CANCEL_MESSAGE.pack(client_order_id), CANCEL_MESSAGE_SIZE)
+        self._send(self._cancel_type, self._cancel_pack(client_order_id), self._cancel_size)
 
     def send_hedge_order(self, client_order_id: int, side: Side, price: int, volume: int) -> None:
         """Order lots in the future to hedge a position."""
-        self.send_message(MessageType.HEDGE_ORDER,
-                          HEDGE_MESSAGE.pack(client_order_id, side, price, volume),
-                          HEDGE_MESSAGE_SIZE)
+        self._send(self._hedge_type, self._hedge_pack(client_order_id, side, price, volume), self._hedge_size)
 
     def send_insert_order(self, client_order_id: int, side: Side, price: int, volume: int, lifespan: Lifespan) -> None:
         """Insert a new order into the market."""
-        self.send_message(MessageType.INSERT_ORDER,
-                          INSERT_MESSAGE.pack(client_order_id, side, price, volume, lifespan),
-                          INSERT_MESSAGE_SIZE)
+        self._send(self._insert_type, self._insert_pack(client_order_id, side, price, volume, lifespan),
+                   self._insert_size)
+
+
+class _ExecutionProtocol(asyncio.BufferedProtocol):
+    """Forwards execution channel events to an auto-trader."""
+    __slots__ = ("__trader",)
+
+    def __init__(self, trader: BaseAutoTrader):
+        self.__trader = trader
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.__trader.on_execution_connection_made(transport)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.__trader.on_execution_connection_lost(exc)
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self.__trader.get_buffer(sizehint)
+
+    def buffer_updated(self, nbytes: int) -> None:
+        self.__trader.buffer_updated(nbytes)
+
+
+class _InformationProtocol(asyncio.DatagramProtocol):
+    """Forwards information channel events to an auto-trader."""
+    __slots__ = ("__trader",)
+
+    def __init__(self, trader: BaseAutoTrader):
+        self.__trader = trader
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.__trader.on_information_connection_made(transport)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.__trader.on_information_connection_lost(exc)
+
+    def datagram_received(self, data: bytes, address) -> None:
+        self.__trader.datagram_received(data, address)
@@ -15,22 +15,116 @@
 #     You should have received a copy of the GNU Affero General Public
 #     License along with Ready Trader Go.  If not, see
 #     <https://www.gnu.org/licenses/>.
-import bisect
 import logging
 
 from typing import Any, Callable, Dict, Iterable, List, Optional
 
-from .account import AccountFactory, CompetitorAccount
+from .account import AccountFactory, CompetitorAccount, update_all
 from .match_events import MatchEvents
-from .order_book import IOrderListener, Order, OrderBook
-from .score_board import ScoreBoardWriter
+from .order_book import IOrderListener, MAXIMUM_ASK, MINIMUM_BID, Order, OrderBook
+from .score_board import ScoreBoardWriter, ScoreRecord
 from .timer import Timer
 from .types import ICompetitor, IController, IExecutionConnection, Instrument, Lifespan, Side
 from .unhedged_lots import UnhedgedLots, UnhedgedLotsFactory
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; the validators below work unchanged without it.
+    njit = None
+
+_INFO = logging.INFO
+
+_BUY = int(Side.BUY)
+_SELL = int(Side.SELL)
+_FILL_AND_KILL = int(Lifespan.FILL_AND_KILL)
+_GOOD_FOR_DAY = int(Lifespan.GOOD_FOR_DAY)
+
+_ETF = Instrument.ETF
+_FUTURE = Instrument.FUTURE
+
+# Enum members indexed by the raw wire value, avoiding a metaclass call
+# to coerce each validated message field back to its enum type
+_SIDES = (Side.SELL, Side.BUY)
+_LIFESPANS = (Lifespan.FILL_AND_KILL, Lifespan.GOOD_FOR_DAY)
+
+# Insert rejection messages indexed by the code returned by _validate_insert;
+# codes one and two take the offending value as a format argument.
+_INSERT_ERRORS = (
+    b"",
+    b"%d is not a valid side",
+    b"%d is not a valid lifespan",
+    b"price is not a multiple of tick size",
+    b"order rejected: active order count limit breached",
+    b"order rejected: invalid volume",
+    b"order rejected: active order volume limit breached",
+    b"order rejected: market not yet open",
+    b"order rejected: in cross with an existing order",
+)
+
+# Hedge rejection messages indexed by the code returned by _validate_hedge;
+# code one takes the offending value as a format argument.
+_HEDGE_ERRORS = (
+    b"",
+    b"%d is not a valid side",
+    b"price is not a multiple of tick size",
+    b"order rejected: invalid volume",
+    b"order rejected: market not yet open",
+)
+
+
+def _validate_insert(side: int, lifespan: int, price: int, tick_size: int, tick_mask: int, volume: int,
+                     order_count: int, order_count_limit: int, active_volume: int, active_volume_limit: int,
+                     now: float, best_buy_price: int, best_sell_price: int) -> int:
+    """Return zero if the insert order is valid, otherwise a rejection code."""
+    if side != _BUY and side != _SELL:
+        return 1
+    if lifespan != _FILL_AND_KILL and lifespan != _GOOD_FOR_DAY:
+        return 2
+    if (price & tick_mask if tick_mask >= 0 else price % tick_size) != 0:
+        return 3
+    if order_count == order_count_limit:
+        return 4
+    if volume < 1:
+        return 5
+    if active_volume + volume > active_volume_limit:
+        return 6
+    if now == 0.0:
+        return 7
+    if (side == _BUY and price >= best_sell_price) or (side == _SELL and price <= best_buy_price):
+        return 8
+    return 0
+
+
+def _validate_hedge(side: int, price: int, tick_size: int, tick_mask: int, volume: int, now: float) -> int:
+    """Return zero if the hedge order is valid, otherwise a rejection code."""
+    if side != _BUY and side != _SELL:
+        return 1
+    if (price & tick_mask if tick_mask >= 0 else price % tick_size) != 0:
+        return 2
+    if volume < 1:
+        return 3
+    if now == 0.0:
+        return 4
+    return 0
+
+
+if njit is not None:
+    _validate_insert = njit(cache=True)(_validate_insert)
+    _validate_hedge = njit(cache=True)(_validate_hedge)
+    # Warm the compilation cache at import time rather than on the first order.
+    _validate_insert(0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 1.0, MINIMUM_BID - 1, MAXIMUM_ASK + 1)
+    _validate_hedge(0, 0, 1, 0, 1, 1.0)
+
 
 class Competitor(ICompetitor, IOrderListener):
     """A competitor in the Ready Trader Go competition."""
+    __slots__ = ("account", "active_volume", "active_volume_limit", "best_buy_price", "best_sell_price",
+                 "buy_price_counts", "controller", "etf_book", "exec_connection", "future_book", "identifier",
+                 "last_client_order_id", "logger", "match_events", "name", "order_count_limit", "orders",
+                 "position_limit", "score_board", "sell_price_counts", "status", "tick_size", "unhedged_etf_lots",
+                 "_match_amend", "_match_cancel", "_match_fill", "_match_hedge", "_match_insert",
+                 "_tick_etf_price", "_tick_future_price", "_tick_mask")
 
     def __init__(self, name: str, exec_channel: IExecutionConnection, etf_book: OrderBook, future_book: OrderBook,
                  account: CompetitorAccount, match_events: MatchEvents, score_board: ScoreBoardWriter,
@@ -41,23 +135,74 @@ class Competitor(ICompetitor, IOrderListener):
         self.active_volume: int = 0
         self.active_volume_limit: int = active_volume_limit
         self.controller: IController = controller
+        self.best_buy_price: int = MINIMUM_BID - 1
+        self.best_sell_price: int = MAXIMUM_ASK + 1
+        self.buy_price_counts: Dict[int, int] = dict()
         self.etf_book: OrderBook = etf_book
         self.future_book: OrderBook = future_book
-        self.buy_prices: List[int] = list()
         self.exec_connection: IExecutionConnection = exec_channel
+        # Small integer id assigned by the competitor manager at login;
+        # stamped on match events so consumers need not map the name
+        self.identifier: int = 0
         self.last_client_order_id: int = -1
         self.logger: logging.Logger = logging.getLogger("COMPETITOR")
         self.match_events: MatchEvents = match_events
+        # Pre-bound match event emitters for the per-message callbacks
+        self._match_amend = match_events.amend
+        self._match_cancel = match_events.cancel
+        self._match_fill = match_events.fill
+        self._match_hedge = match_events.hedge
+        self._match_insert = match_events.insert
         self.order_count_limit: int = order_count_limit
         self.name: str = name
         self.orders: Dict[int, Order] = dict()
         self.position_limit: int = position_limit
         self.score_board: ScoreBoardWriter = score_board
-        self.sell_prices: List[int] = list()
+        self.sell_price_counts: Dict[int, int] = dict()
         self.status: str = "OK"
+        # Last traded prices captured at the most recent timer tick; used in
+        # the per-fill path so each fill avoids re-querying the order books
+        self._tick_future_price: int = 0
+        self._tick_etf_price: int = 0
         self.tick_size: int = int(tick_size * 100.0)  # convert tick size to cents
+        # When the tick size is a power of two the alignment check can use a
+        # bit mask instead of a modulo; -1 marks the general case
+        self._tick_mask: int = self.tick_size - 1 if self.tick_size & (self.tick_size - 1) == 0 else -1
         self.unhedged_etf_lots: UnhedgedLots = unhedged_lots_factory.create(self.on_unhedged_lots_expiry)
 
+    def _add_price(self, side: Side, price: int) -> None:
+        """Record the price of an order placed by this competitor."""
+        if side == _BUY:
+            counts = self.buy_price_counts
+            if price > self.best_buy_price:
+                self.best_buy_price = price
+        else:
+            counts = self.sell_price_counts
+            if price < self.best_sell_price:
+                self.best_sell_price = price
+        counts[price] = counts.get(price, 0) + 1
+
+    def _remove_price(self, side: Side, price: int) -> None:
+        """Remove the price of a completed order from this competitor's records."""
+        if side == _BUY:
+            counts = self.buy_price_counts
+            count = counts[price] - 1
+            if count:
+                counts[price] = count
+            else:
+                del counts[price]
+                if price == self.best_buy_price:
+                    self.best_buy_price = max(counts) if counts else MINIMUM_BID - 1
+        else:
+            counts = self.sell_price_counts
+            count = counts[price] - 1
+            if count:
+                counts[price] = count
+            else:
+                del counts[price]
+                if price == self.best_sell_price:
+                    self.best_sell_price = min(counts) if counts else MAXIMUM_ASK + 1
+
     def disconnect(self, now: float) -> None:
         """Disconnect this competitor."""
         if self.exec_connection is not None:
@@ -76,40 +221,57 @@ class Competitor(ICompetitor, IOrderListener):
         self.exec_connection = None
         self.score_board.disconnect(now, self.name, self.account, self.etf_book.last_traded_price(),
                                     self.future_book.last_traded_price())
-        for o in tuple(self.orders.values()):
-            self.etf_book.cancel(now, o)
+
+        # Cancel all remaining orders directly: with the connection gone there
+        # is no-one to send order status to, so the per-order listener
+        # bookkeeping can be replaced by clearing the structures once
+        remove_volume = self.etf_book.remove_volume_from_level
+        match_cancel = self._match_cancel
+        name = self.name
+        identifier = self.identifier
+        for order in self.orders.values():
+            remaining = order.remaining_volume
+            if remaining > 0:
+                remove_volume(order.price, remaining, order.side)
+                order.remaining_volume = 0
+                match_cancel(now, name, identifier, order.client_order_id, -remaining)
+        self.orders.clear()
+        self.buy_price_counts.clear()
+        self.sell_price_counts.clear()
+        self.best_buy_price = MINIMUM_BID - 1
+        self.best_sell_price = MAXIMUM_ASK + 1
+        self.active_volume = 0
 
     # IOrderListener callbacks
     def on_order_amended(self, now: float, order: Order, volume_removed: int) -> None:
         """Called when an order is amended."""
-        if self.exec_connection is not None:
-            self.exec_connection.send_order_status(order.client_order_id, order.volume - order.remaining_volume,
-                                                   order.remaining_volume, order.total_fees)
-        self.match_events.amend(now, self.name, order.client_order_id, -volume_removed)
+        client_order_id = order.client_order_id
+        remaining_volume = order.remaining_volume
+        exec_connection = self.exec_connection
+        if exec_connection is not None:
+            exec_connection.send_order_status(client_order_id, order.volume - remaining_volume, remaining_volume,
+                                              order.total_fees)
+        self._match_amend(now, self.name, self.identifier, client_order_id, -volume_removed)
 
         self.active_volume -= volume_removed
 
-        if order.remaining_volume == 0:
-            del self.orders[order.client_order_id]
-            if order.side == Side.BUY:
-                self.buy_prices.pop(bisect.bisect(self.buy_prices, order.price) - 1)
-            else:
-                self.sell_prices.pop(bisect.bisect(self.sell_prices, -order.price) - 1)
+        if remaining_volume == 0:
+            del self.orders[client_order_id]
+            self._remove_price(order.side, order.price)
 
     def on_order_cancelled(self, now: float, order: Order, volume_removed: int) -> None:
         """Called when an order is cancelled."""
-        if self.exec_connection is not None:
-            self.exec_connection.send_order_status(order.client_order_id, order.volume - volume_removed,
-                                                   order.remaining_volume, order.total_fees)
-        self.match_events.cancel(now, self.name, order.client_order_id, -volume_removed)
+        client_order_id = order.client_order_id
+        exec_connection = self.exec_connection
+        if exec_connection is not None:
+            exec_connection.send_order_status(client_order_id, order.volume - volume_removed,
+                                              order.remaining_volume, order.total_fees)
+        self._match_cancel(now, self.name, self.identifier, client_order_id, -volume_removed)
 
         self.active_volume -= volume_removed
 
-        del self.orders[order.client_order_id]
-        if order.side == Side.BUY:
-            self.buy_prices.pop(bisect.bisect(self.buy_prices, order.price) - 1)
-        else:
-            self.sell_prices.pop(bisect.bisect(self.sell_prices, -order.price) - 1)
+        del self.orders[client_order_id]
+        self._remove_price(order.side, order.price)
 
     def on_order_placed(self, now: float, order: Order) -> None:
         """Called when a good-for-day order is placed in the order book."""
@@ -121,26 +283,32 @@ class Competitor(ICompetitor, IOrderListener):
         """Called when an order is partially or completely filled."""
         self.active_volume -= volume
 
-        if order.remaining_volume == 0:
-            del self.orders[order.client_order_id]
-            if order.side == Side.BUY:
-                self.buy_prices.pop()
-            else:
-                self.sell_prices.pop()
-
-        self.unhedged_etf_lots.apply_position_delta(volume if order.side == Side.BUY else -volume)
-
-        self.match_events.fill(now, self.name, order.client_order_id, order.instrument, order.side, price, volume, fee)
-        last_traded: int = self.future_book.last_traded_price() or round(self.future_book.midpoint_price())
-        self.account.transact(Instrument.ETF, order.side, price, volume, fee)
-        self.account.update(last_traded, price)
-
-        if self.exec_connection is not None:
-            self.exec_connection.send_order_filled(order.client_order_id, price, volume)
-            self.exec_connection.send_order_status(order.client_order_id, order.volume - order.remaining_volume,
-                                                   order.remaining_volume, order.total_fees)
-            if not (-self.position_limit <= self.account.etf_position <= self.position_limit):
-                self.hard_breach(now, order.client_order_id, b"ETF position limit breached")
+        client_order_id = order.client_order_id
+        side = order.side
+        remaining_volume = order.remaining_volume
+        if remaining_volume == 0:
+            del self.orders[client_order_id]
+            self._remove_price(side, order.price)
+
+        self.unhedged_etf_lots.apply_position_delta(volume if side == _BUY else -volume)
+
+        self._match_fill(now, self.name, self.identifier, client_order_id, order.instrument, side, price, volume, fee)
+        account = self.account
+        last_traded: int = self._tick_future_price
+        if not last_traded:
+            future_book = self.future_book
+            last_traded = future_book.last_traded_price() or round(future_book.midpoint_price())
+        account.transact(_ETF, side, price, volume, fee)
+        account.update(last_traded, price)
+
+        exec_connection = self.exec_connection
+        if exec_connection is not None:
+            exec_connection.send_order_filled(client_order_id, price, volume)
+            exec_connection.send_order_status(client_order_id, order.volume - remaining_volume, remaining_volume,
+                                              order.total_fees)
+            position_limit = self.position_limit
+            if not (-position_limit <= account.etf_position <= position_limit):
+                self.hard_breach(now, client_order_id, b"ETF position limit breached")
 
     def on_unhedged_lots_expiry(self):
         """Called when unhedged lots have been held for too long."""
@@ -157,8 +325,8 @@ class Competitor(ICompetitor, IOrderListener):
             self.send_error(now, client_order_id, b"out-of-order client_order_id in amend message")
             return
 
-        if client_order_id in self.orders:
-            order = self.orders[client_order_id]
+        order = self.orders.get(client_order_id)
+        if order is not None:
             if volume > order.volume:
                 self.send_error(now, client_order_id, b"amend operation would increase order volume")
             else:
@@ -170,8 +338,9 @@ class Competitor(ICompetitor, IOrderListener):
             self.send_error(now, client_order_id, b"out-of-order client_order_id in cancel message")
             return
 
-        if client_order_id in self.orders:
-            self.etf_book.cancel(now, self.orders[client_order_id])
+        order = self.orders.get(client_order_id)
+        if order is not None:
+            self.etf_book.cancel(now, order)
 
     def on_hedge_message(self, now: float, client_order_id: int, side: int, price: int, volume: int) -> None:
         """Called when a hedge order request is received from the competitor."""
@@ -181,35 +350,32 @@ class Competitor(ICompetitor, IOrderListener):
 
         self.last_client_order_id = client_order_id
 
-        if side != Side.BUY and side != Side.SELL:
-            self.send_error(now, client_order_id, b"%d is not a valid side" % side)
+        code = _validate_hedge(side, price, self.tick_size, self._tick_mask, volume, now)
+        if code:
+            message = _HEDGE_ERRORS[code]
+            self.send_error(now, client_order_id, message % side if code == 1 else message)
             return
 
-        if price % self.tick_size != 0:
-            self.send_error(now, client_order_id, b"price is not a multiple of tick size")
-            return
-
-        if volume < 1:
-            self.send_error(now, client_order_id, b"order rejected: invalid volume")
-            return
-
-        if now == 0.0:
-            self.send_error(now, client_order_id, b"order rejected: market not yet open")
-            return
-
-        side_: Side = Side(side)
-        volume_traded, average_price = self.future_book.try_trade(side_, price, volume)
+        side_: Side = _SIDES[side]
+        future_book = self.future_book
+        account = self.account
+        volume_traded, average_price = future_book.try_trade(side_, price, volume)
         if volume_traded > 0:
-            self.unhedged_etf_lots.apply_position_delta(volume_traded if side_ == Side.BID else -volume_traded)
-            self.match_events.hedge(now, self.name, client_order_id, Instrument.FUTURE, side_, average_price,
-                                    volume_traded)
-            self.account.transact(Instrument.FUTURE, side_, average_price, volume_traded, 0)
-            self.account.update(self.future_book.last_traded_price() or self.future_book.midpoint_price(),
-                                self.etf_book.last_traded_price() or self.etf_book.midpoint_price())
-
-        if self.exec_connection is not None:
-            self.exec_connection.send_hedge_filled(client_order_id, average_price, volume_traded)
-            if not (-self.position_limit <= self.account.future_position <= self.position_limit):
+            self.unhedged_etf_lots.apply_position_delta(volume_traded if side_ == _BUY else -volume_traded)
+            self._match_hedge(now, self.name, self.identifier, client_order_id, _FUTURE, side_, average_price,
+                              volume_traded)
+            account.transact(_FUTURE, side_, average_price, volume_traded, 0)
+            etf_book = self.etf_book
+            account.update(self._tick_future_price or future_book.last_traded_price()
+                           or round(future_book.midpoint_price()),
+                           self._tick_etf_price or etf_book.last_traded_price()
+                           or round(etf_book.midpoint_price()))
+
+        exec_connection = self.exec_connection
+        if exec_connection is not None:
+            exec_connection.send_hedge_filled(client_order_id, average_price, volume_traded)
+            position_limit = self.position_limit
+            if not (-position_limit <= account.future_position <= position_limit):
                 self.hard_breach(now, client_order_id, b"future position limit breached")
 
     def on_insert_message(self, now: float, client_order_id: int, side: int, price: int, volume: int,
@@ -221,60 +387,44 @@ class Competitor(ICompetitor, IOrderListener):
 
         self.last_client_order_id = client_order_id
 
-        if side != Side.BUY and side != Side.SELL:
-            self.send_error(now, client_order_id, b"%d is not a valid side" % side)
-            return
-
-        if lifespan != Lifespan.FILL_AND_KILL and lifespan != Lifespan.GOOD_FOR_DAY:
-            self.send_error(now, client_order_id, b"%d is not a valid lifespan" % lifespan)
-            return
-
-        if price % self.tick_size != 0:
-            self.send_error(now, client_order_id, b"price is not a multiple of tick size")
-            return
-
-        if len(self.orders) == self.order_count_limit:
-            self.send_error(now, client_order_id, b"order rejected: active order count limit breached")
-            return
-
-        if volume < 1:
-            self.send_error(now, client_order_id, b"order rejected: invalid volume")
-            return
-
-        if self.active_volume + volume > self.active_volume_limit:
-            self.send_error(now, client_order_id, b"order rejected: active order volume limit breached")
-            return
-
-        if now == 0.0:
-            self.send_error(now, client_order_id, b"order rejected: market not yet open")
+        code = _validate_insert(side, lifespan, price, self.tick_size, self._tick_mask, volume, len(self.orders),
+                                self.order_count_limit, self.active_volume, self.active_volume_limit, now,
+                                self.best_buy_price, self.best_sell_price)
+        if code:
+            message = _INSERT_ERRORS[code]
+            if code <= 2:
+                message = message % (side if code == 1 else lifespan)
+            self.send_error(now, client_order_id, message)
             return
 
-        if ((side == Side.BUY and self.sell_prices and price >= -self.sell_prices[-1])
-                or (side == Side.SELL and self.buy_prices and price <= self.buy_prices[-1])):
-            self.send_error(now, client_order_id, b"order rejected: in cross with an existing order")
-            return
-
-        order = self.orders[client_order_id] = Order(client_order_id, Instrument.ETF, Lifespan(lifespan), Side(side),
+        order = self.orders[client_order_id] = Order(client_order_id, _ETF, _LIFESPANS[lifespan], _SIDES[side],
                                                      price, volume, self)
-        if side == Side.BUY:
-            bisect.insort(self.buy_prices, price)
-        else:
-            bisect.insort(self.sell_prices, -price)
-        self.match_events.insert(now, self.name, order.client_order_id, order.instrument, order.side, order.volume,
-                                 order.price, order.lifespan)
+        self._add_price(order.side, price)
+        self._match_insert(now, self.name, self.identifier, order.client_order_id, order.instrument, order.side,
+                           order.volume, order.price, order.lifespan)
         self.active_volume += volume
         self.etf_book.insert(now, order)
 
-    def on_timer_tick(self, now: float, future_price: int, etf_price: int) -> None:
-        """Called on each timer tick to update the auto-trader."""
-        self.account.update(future_price or 0, etf_price or 0)
-        self.score_board.tick(now, self.name, self.account, etf_price, future_price, self.status)
+    def on_timer_tick(self, now: float, future_price: int, etf_price: int) -> ScoreRecord:
+        """Called on each timer tick after this competitor's account has been updated.
+
+        Returns this competitor's score record for the tick; the caller
+        queues the records for the whole tick as one batch.
+        """
+        self._tick_future_price = future_price or 0
+        self._tick_etf_price = etf_price or 0
+        account = self.account
+        return ScoreRecord(now, self.name, "Tick", account.buy_volume, account.sell_volume, account.etf_position,
+                           account.future_position, etf_price, future_price, account.total_fees,
+                           account.account_balance, account.profit_or_loss, self.status)
 
     def send_error(self, now: float, client_order_id: int, message: bytes) -> None:
         """Send an error message to the auto-trader and shut down the match."""
         self.exec_connection.send_error(client_order_id, message)
-        self.logger.info("'%s' sent error message: time=%.6f client_order_id=%s message='%s'", self.name, now,
-                         client_order_id, message.decode())
+        logger = self.logger
+        if logger.isEnabledFor(_INFO):
+            logger.info("'%s' sent error message: time=%.6f client_order_id=%s message='%s'", self.name, now,
+                        client_order_id, message.decode())
 
     def send_error_and_close(self, now: float, client_order_id: int, message: bytes) -> None:
         """Send an error message to the auto-trader and shut down the match."""
@@ -302,13 +452,17 @@ class CompetitorManager:
         self.__position_limit: int = limits_config["PositionLimit"]
         self.__score_board_writer: ScoreBoardWriter = score_board_writer
         self.__start_time: float = 0.0
+        # Parallel lists over the competitors, maintained at login so the
+        # per-tick loop iterates flat lists instead of rebuilding them
+        self.__accounts: List[CompetitorAccount] = list()
+        self.__tick_callbacks: List[Callable[[float, int, int], ScoreRecord]] = list()
         self.__traders: Dict[str, str] = traders_config
         self.__unhedged_lots_factory: UnhedgedLotsFactory = unhedged_lots_factory
         self.__tick_size: float = tick_size
 
         self.active_competitor_count: int = 0
         self.controller: Optional[IController] = None
-        self.competitor_logged_in: List[Callable[[str], None]] = list()
+        self.competitor_logged_in: List[Callable[[str, int], None]] = list()
 
         timer.timer_started.append(self.on_timer_started)
         timer.timer_stopped.append(self.on_timer_stopped)
@@ -327,13 +481,17 @@ class CompetitorManager:
                                 self.__account_factory.create(), self.__match_events, self.__score_board_writer,
                                 self.__position_limit, self.__order_count_limit, self.__active_volume_limit,
                                 self.__tick_size, self.__unhedged_lots_factory, self.controller)
+        # Identifier zero is reserved for anonymous market participants
+        competitor.identifier = len(self.__competitors) + 1
         self.__competitors[name] = competitor
+        self.__accounts.append(competitor.account)
+        self.__tick_callbacks.append(competitor.on_timer_tick)
 
         if self.__start_time != 0.0:
             self.__logger.warning("competitor logged in after market open: name='%s'", name)
 
         for callback in self.competitor_logged_in:
-            callback(name)
+            callback(name, competitor.identifier)
 
         return competitor
 
@@ -358,8 +516,10 @@ class CompetitorManager:
         """Called on each timer tick."""
         etf_price = self.__etf_book.last_traded_price()
         future_price = self.__future_book.last_traded_price()
-        for competitor in self.__competitors.values():
-            competitor.on_timer_tick(now, future_price, etf_price)
+        if self.__accounts:
+            update_all(self.__accounts, future_price or 0, etf_price or 0)
+            self.__score_board_writer.tick_batch(
+                [callback(now, future_price, etf_price) for callback in self.__tick_callbacks])
 
         if self.active_competitor_count == 0:
             timer.shutdown(now, "no remaining competitors")
@@ -18,7 +18,7 @@
 import asyncio
 import logging
 
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from .execution import ExecutionServer
 from .heads_up import HeadsUpDisplayServer
@@ -40,10 +40,14 @@ class Controller(IController):
         self.heads_up_display_server: Optional[HeadsUpDisplayServer] = None
 
         self.__done: bool = False
+        self.__event_loop_stop: Callable[[], None] = asyncio.get_event_loop().stop
         self.__execution_server: ExecutionServer = exec_server
         self.__information_publisher: InformationPublisher = info_publisher
         self.__logger: logging.Logger = logging.getLogger("CONTROLLER")
         self.__market_events_reader = market_events_reader
+        # Pre-bound so each market timer tick dispatches through a single
+        # local call rather than two attribute lookups
+        self.__process_market_events: Callable[[float], None] = market_events_reader.process_market_events
         self.__market_open_delay: float = market_open_delay
         self.__market_timer: Timer = market_timer
         self.__match_events_writer = match_events_writer
@@ -61,7 +65,7 @@ class Controller(IController):
     def advance_time(self):
         """Return the current time after accounting for events."""
         now: float = self.__market_timer.advance()
-        self.__market_events_reader.process_market_events(now)
+        self.__process_market_events(now)
         return now
 
     def cleanup(self) -> None:
@@ -74,7 +78,7 @@ class Controller(IController):
 
     def on_market_timer_ticked(self, timer: Timer, now: float, _: int):
         """Called when it is time to process market events."""
-        self.__market_events_reader.process_market_events(now)
+        self.__process_market_events(now)
 
     def on_task_complete(self, task: Any) -> None:
         """Called when a reader or writer task is complete"""
@@ -86,7 +90,7 @@ class Controller(IController):
             self.__done = True
 
         if self.__match_events_writer is None and self.__score_board_writer is None:
-            asyncio.get_running_loop().stop()
+            self.__event_loop_stop()
 
     def on_tick_timer_stopped(self, timer: Timer, now: float) -> None:
         """Shut down the match."""
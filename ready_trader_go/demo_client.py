@@ -15,7 +15,7 @@
 #     You should have received a copy of the GNU Affero General Public
 #     License along with Ready Trader Go.  If not, see
 #     <https://www.gnu.org/licenses/>.
-import select
+import selectors
 import socket
 
 from typing import Dict, List
@@ -25,6 +25,8 @@ from ready_trader_go.types import Lifespan, Side
 
 
 class Fill:
+    __slots__ = ("price", "volume")
+
     def __init__(self, price: int, volume: int):
         """Initialise a new instance of the class."""
         self.price = price
@@ -38,6 +40,9 @@ class Fill:
 
 
 class Order:
+    __slots__ = ("order_id", "side", "price", "volume", "lifespan", "fills", "fill_volume", "remaining_volume",
+                 "total_fees")
+
     def __init__(self, order_id: int, side: Side, price_in_cents: int, volume: int, lifespan: Lifespan):
         """Initialise a new instance of the class."""
         self.order_id = order_id
@@ -68,11 +73,31 @@ class DemoClient:
         self.name: str = name
         self.secret: str = secret
 
-        self.__buffer = bytearray()
+        self.__buffer = bytearray(65536)
+        self.__read_off: int = 0
+        self.__write_off: int = 0
         self.__last_order_id: int = 0
         self.__orders: Dict = dict()
+        self.__selector: Optional[selectors.BaseSelector] = None
         self.__sock: Optional[socket.socket] = None
 
+        self.__amend_message = bytearray(AMEND_MESSAGE_SIZE)
+        self.__cancel_message = bytearray(CANCEL_MESSAGE_SIZE)
+        self.__insert_message = bytearray(INSERT_MESSAGE_SIZE)
+
+        HEADER.pack_into(self.__amend_message, 0, AMEND_MESSAGE_SIZE, MessageType.AMEND_ORDER)
+        HEADER.pack_into(self.__cancel_message, 0, CANCEL_MESSAGE_SIZE, MessageType.CANCEL_ORDER)
+        HEADER.pack_into(self.__insert_message, 0, INSERT_MESSAGE_SIZE, MessageType.INSERT_ORDER)
+
+        # Message type mapped to expected length, payload decoder and handler.
+        self.__message_handlers = {
+            int(MessageType.ERROR): (ERROR_MESSAGE_SIZE, ERROR_MESSAGE.unpack_from, self.__on_error_message),
+            int(MessageType.ORDER_FILLED): (ORDER_FILLED_MESSAGE_SIZE, ORDER_FILLED_MESSAGE.unpack_from,
+                                            self.__on_order_filled_message),
+            int(MessageType.ORDER_STATUS): (ORDER_STATUS_MESSAGE_SIZE, ORDER_STATUS_MESSAGE.unpack_from,
+                                            self.__on_order_status_message),
+        }
+
     @staticmethod
     def display_error(message: str) -> None:
         """Display an error message."""
@@ -92,6 +117,8 @@ class DemoClient:
             print("Connect failed: %s" % e.strerror)
             return
         self.__sock.setblocking(False)
+        self.__selector = selectors.DefaultSelector()
+        self.__selector.register(self.__sock, selectors.EVENT_READ)
         self.__sock.send(HEADER.pack(LOGIN_MESSAGE_SIZE, MessageType.LOGIN)
                          + LOGIN_MESSAGE.pack(self.name.encode(), self.secret.encode()))
 
@@ -107,13 +134,13 @@ class DemoClient:
 
         The new volume must be less than or equal to the original volume.
         """
-        self.__sock.send(HEADER.pack(AMEND_MESSAGE_SIZE, MessageType.AMEND_ORDER)
-                         + AMEND_MESSAGE.pack(order_id, new_volume))
+        AMEND_MESSAGE.pack_into(self.__amend_message, HEADER_SIZE, order_id, new_volume)
+        self.__sock.send(self.__amend_message)
 
     def send_cancel_order(self, order_id: int) -> None:
         """Cancel the specified order."""
-        self.__sock.send(HEADER.pack(CANCEL_MESSAGE_SIZE, MessageType.CANCEL_ORDER)
-                         + CANCEL_MESSAGE.pack(order_id))
+        CANCEL_MESSAGE.pack_into(self.__cancel_message, HEADER_SIZE, order_id)
+        self.__sock.send(self.__cancel_message)
 
     def send_insert_order(self, order_id: int, side: Side, price_in_cents: int, volume: int,
                           lifespan: Lifespan) -> Order:
@@ -127,54 +154,66 @@ class DemoClient:
         """
         if order_id <= self.__last_order_id:
             raise ValueError("order_id must be greater than 0 and greater than the last order id")
-        self.__sock.send(HEADER.pack(INSERT_MESSAGE_SIZE, MessageType.INSERT_ORDER)
-                         + INSERT_MESSAGE.pack(order_id, side, price_in_cents, volume, lifespan))
+        INSERT_MESSAGE.pack_into(self.__insert_message, HEADER_SIZE, order_id, side, price_in_cents, volume, lifespan)
+        self.__sock.send(self.__insert_message)
         self.__orders[order_id] = Order(order_id, side, price_in_cents, volume, lifespan)
         return self.__orders[order_id]
 
     def update_orders(self) -> None:
         """Process messages from the exchange and update orders."""
         try:
-            ready, _, _ = select.select([self.__sock], [self.__sock], [], 0)
-        except select.error as e:
+            ready = self.__selector.select(0)
+        except OSError as e:
             self.display_error(str(e))
             return
 
         if ready:
-            data = self.__sock.recv(4096)
-            if len(data) == 0:
+            buffer = self.__buffer
+            write_off: int = self.__write_off
+            received: int = self.__sock.recv_into(memoryview(buffer)[write_off:write_off + 4096])
+            if received == 0:
                 self.display_error("connection to exchange simulator lost")
                 return
 
-            self.__buffer += data
+            write_off += received
 
-            upto: int = 0
-            data_length: int = len(self.__buffer)
+            read_off: int = self.__read_off
+            header_unpack = HEADER.unpack_from
+            on_message = self.__on_message
 
-            while upto < data_length - HEADER_SIZE:
-                length, typ = HEADER.unpack_from(self.__buffer, upto)
-                if upto + length > data_length:
+            while write_off - read_off >= HEADER_SIZE:
+                length, typ = header_unpack(buffer, read_off)
+                if read_off + length > write_off:
                     break
-                self.__on_message(typ, self.__buffer, upto + HEADER_SIZE, length)
-                upto += length
+                on_message(typ, buffer, read_off + HEADER_SIZE, length)
+                read_off += length
+
+            # Recycle the buffer rather than slicing off the consumed prefix;
+            # any unconsumed tail is moved to the front once it is worthwhile.
+            if read_off == write_off:
+                read_off = write_off = 0
+            elif read_off > len(buffer) // 2 or write_off + 4096 > len(buffer):
+                buffer[:write_off - read_off] = buffer[read_off:write_off]
+                write_off -= read_off
+                read_off = 0
 
-            self.__buffer = self.__buffer[upto:]
+            self.__read_off = read_off
+            self.__write_off = write_off
 
     @staticmethod
     def __on_error_message(order_id: int, message: bytes) -> None:
+        end: int = message.find(b"\x00")
+        if end >= 0:
+            message = message[:end]
         if order_id != 0:
             print("Error with order %d: %s" % (order_id, message.decode()))
         else:
             print("Error reported: %s" % message.decode())
 
     def __on_message(self, typ: int, data: bytearray, start: int, length: int) -> None:
-        if typ == MessageType.ERROR and length == ERROR_MESSAGE_SIZE:
-            client_order_id, error_message = ERROR_MESSAGE.unpack_from(data, start)
-            self.__on_error_message(client_order_id, error_message.rstrip(b"\x00"))
-        elif typ == MessageType.ORDER_FILLED and length == ORDER_FILLED_MESSAGE_SIZE:
-            self.__on_order_filled_message(*ORDER_FILLED_MESSAGE.unpack_from(data, start))
-        elif typ == MessageType.ORDER_STATUS and length == ORDER_STATUS_MESSAGE_SIZE:
-            self.__on_order_status_message(*ORDER_STATUS_MESSAGE.unpack_from(data, start))
+        entry = self.__message_handlers.get(typ)
+        if entry is not None and length == entry[0]:
+            entry[2](*entry[1](data, start))
         else:
             print("received invalid message: length=%d type=%d", length, typ)
 
@@ -17,8 +17,9 @@
 #     <https://www.gnu.org/licenses/>.
 import asyncio
 import logging
+import socket
 
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from .competitor import Competitor, CompetitorManager
 from .limiter import FrequencyLimiter, FrequencyLimiterFactory
@@ -30,8 +31,19 @@ from .messages import (AMEND_MESSAGE, AMEND_MESSAGE_SIZE, CANCEL_MESSAGE, CANCEL
                        Connection, MessageType)
 from .types import IController, IExecutionConnection
 
+_INFO = logging.INFO
+
 
 class ExecutionConnection(Connection, IExecutionConnection):
+    # Message type mapped to expected length, payload decoder and the name of
+    # the competitor callback; bound to the competitor instance at login.
+    _MESSAGE_HANDLERS: Dict[int, Tuple[int, Callable, str]] = {
+        int(MessageType.AMEND_ORDER): (AMEND_MESSAGE_SIZE, AMEND_MESSAGE.unpack_from, "on_amend_message"),
+        int(MessageType.CANCEL_ORDER): (CANCEL_MESSAGE_SIZE, CANCEL_MESSAGE.unpack_from, "on_cancel_message"),
+        int(MessageType.HEDGE_ORDER): (HEDGE_MESSAGE_SIZE, HEDGE_MESSAGE.unpack_from, "on_hedge_message"),
+        int(MessageType.INSERT_ORDER): (INSERT_MESSAGE_SIZE, INSERT_MESSAGE.unpack_from, "on_insert_message"),
+    }
+
     def __init__(self, competitor_manager: CompetitorManager, frequency_limiter: FrequencyLimiter,
                  controller: IController):
         """Initialise a new instance of the ExecutionChannel class."""
@@ -39,21 +51,28 @@ class ExecutionConnection(Connection, IExecutionConnection):
 
         self.competitor: Optional[Competitor] = None
         self.competitor_manager: CompetitorManager = competitor_manager
+        self.__dispatch: Dict[int, Tuple[int, Callable, Callable]] = {}
+        self.__dispatch_get: Callable = self.__dispatch.get
+
+        # Bound once so the per-message path is three local calls rather
+        # than repeated attribute chains
+        self.__advance_time: Callable[[], float] = controller.advance_time
+        self.__check_event: Callable[[float], bool] = frequency_limiter.check_event
         self.controller: IController = controller
         self.closing: bool = False
         self.frequency_limiter: FrequencyLimiter = frequency_limiter
         self.logger: logging.Logger = logging.getLogger("EXECUTION")
-        self.login_timeout: asyncio.Handle = asyncio.get_running_loop().call_later(1.0, self.close)
+        loop = asyncio.get_running_loop()
+        self.login_timeout: asyncio.Handle = loop.call_later(1.0, self.close)
 
-        self.__error_message = bytearray(ERROR_MESSAGE_SIZE)
-        self.__hedge_filled_message = bytearray(HEDGE_FILLED_MESSAGE_SIZE)
-        self.__order_status_message = bytearray(ORDER_STATUS_MESSAGE_SIZE)
-        self.__order_filled_message = bytearray(ORDER_FILLED_MESSAGE_SIZE)
+        self.__call_soon: Callable = loop.call_soon
+        self.__flush_pending: bool = False
+        self.__pending_writes: List[bytes] = []
 
-        HEADER.pack_into(self.__error_message, 0, ERROR_MESSAGE_SIZE, MessageType.ERROR)
-        HEADER.pack_into(self.__hedge_filled_message, 0, HEDGE_FILLED_MESSAGE_SIZE, MessageType.HEDGE_FILLED)
-        HEADER.pack_into(self.__order_status_message, 0, ORDER_STATUS_MESSAGE_SIZE, MessageType.ORDER_STATUS)
-        HEADER.pack_into(self.__order_filled_message, 0, ORDER_FILLED_MESSAGE_SIZE, MessageType.ORDER_FILLED)
+        self.__error_header: bytes = HEADER.pack(ERROR_MESSAGE_SIZE, MessageType.ERROR)
+        self.__hedge_filled_header: bytes = HEADER.pack(HEDGE_FILLED_MESSAGE_SIZE, MessageType.HEDGE_FILLED)
+        self.__order_status_header: bytes = HEADER.pack(ORDER_STATUS_MESSAGE_SIZE, MessageType.ORDER_STATUS)
+        self.__order_filled_header: bytes = HEADER.pack(ORDER_FILLED_MESSAGE_SIZE, MessageType.ORDER_FILLED)
 
     def __del__(self):
         """Clean up this instance of the ExecutionChannel class."""
@@ -61,6 +80,8 @@ class ExecutionConnection(Connection, IExecutionConnection):
 
     def close(self):
         """Close the connection associated with this ExecutionChannel instance."""
+        if self.__pending_writes:
+            self.__flush()
         Connection.close(self)
         self.login_timeout.cancel()
         self.closing = True
@@ -81,15 +102,24 @@ class ExecutionConnection(Connection, IExecutionConnection):
     def connection_made(self, transport: asyncio.transports.BaseTransport) -> None:
         """Called when the connection is established."""
         Connection.connection_made(self, transport)
+        sock = transport.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 262144)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 262144)
+            if hasattr(socket, "TCP_QUICKACK"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
         self.competitor_manager.on_competitor_connect()
 
     def on_message(self, typ: int, data: bytes, start: int, length: int) -> None:
         """Called when a message is received from the auto-trader."""
-        now: float = self.controller.advance_time()
+        now: float = self.__advance_time()
 
-        if self.frequency_limiter.check_event(now):
-            self.logger.info("fd=%d message frequency limit breached: now=%.6f value=%d limit=%d",
-                             self._file_number, now, self.frequency_limiter.value, self.frequency_limiter.limit)
+        if self.__check_event(now):
+            logger = self.logger
+            if logger.isEnabledFor(_INFO):
+                logger.info("fd=%d message frequency limit breached: now=%.6f value=%d limit=%d",
+                            self._file_number, now, self.frequency_limiter.value, self.frequency_limiter.limit)
             if self.competitor is not None:
                 self.competitor.hard_breach(now, 0, b"message frequency limit breached")
             else:
@@ -99,27 +129,27 @@ class ExecutionConnection(Connection, IExecutionConnection):
         if self.competitor is None:
             if typ == MessageType.LOGIN and length == LOGIN_MESSAGE_SIZE:
                 raw_name, raw_secret = LOGIN_MESSAGE.unpack_from(data, start)
-                self.on_login(raw_name.rstrip(b"\x00").decode(), raw_secret.rstrip(b"\x00").decode())
+                name_end: int = raw_name.find(b"\x00")
+                secret_end: int = raw_secret.find(b"\x00")
+                self.on_login(raw_name[:name_end if name_end >= 0 else None].decode(),
+                              raw_secret[:secret_end if secret_end >= 0 else None].decode())
             else:
                 self.logger.info("fd=%d first message received was not a login", self._file_number)
                 self.close()
             return
 
-        if typ == MessageType.AMEND_ORDER and length == AMEND_MESSAGE_SIZE:
-            self.competitor.on_amend_message(now, *AMEND_MESSAGE.unpack_from(data, start))
-        elif typ == MessageType.CANCEL_ORDER and length == CANCEL_MESSAGE_SIZE:
-            self.competitor.on_cancel_message(now, *CANCEL_MESSAGE.unpack_from(data, start))
-        elif typ == MessageType.HEDGE_ORDER and length == HEDGE_MESSAGE_SIZE:
-            self.competitor.on_hedge_message(now, *HEDGE_MESSAGE.unpack_from(data, start))
-        elif typ == MessageType.INSERT_ORDER and length == INSERT_MESSAGE_SIZE:
-            self.competitor.on_insert_message(now, *INSERT_MESSAGE.unpack_from(data, start))
+        entry = self.__dispatch_get(typ)
+        if entry is not None and length == entry[0]:
+            entry[2](now, *entry[1](data, start))
         else:
+            logger = self.logger
             if typ == MessageType.LOGIN:
-                self.logger.info("fd=%d received second login message: time=%.6f name='%s'", self._file_number,
-                                 now, self.competitor.name)
-            else:
-                self.logger.info("fd=%d '%s' received invalid message: time=%.6f length=%d type=%d",
-                                 self._file_number, self.competitor.name, now, length, typ)
+                if logger.isEnabledFor(_INFO):
+                    logger.info("fd=%d received second login message: time=%.6f name='%s'", self._file_number,
+                                now, self.competitor.name)
+            elif logger.isEnabledFor(_INFO):
+                logger.info("fd=%d '%s' received invalid message: time=%.6f length=%d type=%d",
+                            self._file_number, self.competitor.name, now, length, typ)
             self.close()
 
     def on_login(self, name: str, secret: str) -> None:
@@ -132,29 +162,50 @@ class ExecutionConnection(Connection, IExecutionConnection):
             self.close()
             return
 
+        self.__dispatch = {typ: (size, unpack, getattr(self.competitor, name))
+                           for typ, (size, unpack, name) in self._MESSAGE_HANDLERS.items()}
+        self.__dispatch_get = self.__dispatch.get
         self.logger.info("fd=%d '%s' is ready!", self._file_number, name)
 
+    def __flush(self) -> None:
+        """Write out any messages queued during this event-loop iteration."""
+        self.__flush_pending = False
+        if not self.__pending_writes:
+            return
+        transport = self._connection_transport
+        if transport is not None and not transport.is_closing():
+            transport.writelines(self.__pending_writes)
+        self.__pending_writes.clear()
+
+    def __queue_write(self, data: bytes) -> None:
+        """Queue an outbound message, scheduling a flush if one is not pending.
+
+        Batching the messages generated within one event-loop iteration (a
+        fill and its status update, say) into a single transport write keeps
+        the syscall count down.
+        """
+        self.__pending_writes.append(data)
+        if not self.__flush_pending:
+            self.__flush_pending = True
+            self.__call_soon(self.__flush)
+
     def send_error(self, client_order_id: int, error_message: bytes) -> None:
         """Send an error message to the auto-trader."""
-        ERROR_MESSAGE.pack_into(self.__error_message, HEADER_SIZE, client_order_id, error_message)
-        self._connection_transport.write(self.__error_message)
+        self.__queue_write(self.__error_header + ERROR_MESSAGE.pack(client_order_id, error_message))
 
     def send_hedge_filled(self, client_order_id: int, average_price: int, volume: int) -> None:
         """Send a hedge filled message to the auto-trader."""
-        HEDGE_FILLED_MESSAGE.pack_into(self.__hedge_filled_message, HEADER_SIZE, client_order_id, average_price,
-                                       volume)
-        self._connection_transport.write(self.__hedge_filled_message)
+        self.__queue_write(self.__hedge_filled_header + HEDGE_FILLED_MESSAGE.pack(client_order_id, average_price,
+                                                                                 volume))
 
     def send_order_filled(self, client_order_id: int, price: int, volume: int) -> None:
         """Send an order filled message to the auto-trader."""
-        ORDER_FILLED_MESSAGE.pack_into(self.__order_filled_message, HEADER_SIZE, client_order_id, price, volume)
-        self._connection_transport.write(self.__order_filled_message)
+        self.__queue_write(self.__order_filled_header + ORDER_FILLED_MESSAGE.pack(client_order_id, price, volume))
 
     def send_order_status(self, client_order_id: int, fill_volume: int, remaining_volume: int, fees: int) -> None:
         """Send an order status message to the auto-trader."""
-        ORDER_STATUS_MESSAGE.pack_into(self.__order_status_message, HEADER_SIZE, client_order_id, fill_volume,
-                                       remaining_volume, fees)
-        self._connection_transport.write(self.__order_status_message)
+        self.__queue_write(self.__order_status_header + ORDER_STATUS_MESSAGE.pack(client_order_id, fill_volume,
+                                                                                  remaining_volume, fees))
 
 
 class ExecutionServer:
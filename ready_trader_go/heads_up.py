@@ -16,12 +16,13 @@
 #     License along with Ready Trader Go.  If not, see
 #     <https://www.gnu.org/licenses/>.
 import asyncio
+import itertools
 import logging
 
-from typing import Dict, Optional
+from typing import Optional
 
 from .competitor import CompetitorManager
-from .match_events import MatchEvent, MatchEventOperation, MatchEvents
+from .match_events import MatchEvent, MatchEvents
 from .messages import (AMEND_MESSAGE, AMEND_MESSAGE_SIZE, CANCEL_MESSAGE, CANCEL_MESSAGE_SIZE,
                        ERROR_MESSAGE, ERROR_MESSAGE_SIZE, HEADER, HEADER_SIZE, INSERT_MESSAGE,
                        INSERT_MESSAGE_SIZE, LOGIN_MESSAGE, LOGIN_MESSAGE_SIZE,
@@ -32,34 +33,95 @@ from .messages import (AMEND_MESSAGE, AMEND_MESSAGE_SIZE, CANCEL_MESSAGE, CANCEL
 from .types import ICompetitor, IController, IExecutionConnection
 
 
+# The outbound message buffers of every HudConnection share one layout:
+# sizes, offsets and header bytes are assembled once at import so each
+# connection starts from a single copy of the template
+_ARENA_SIZES = (ERROR_MESSAGE_SIZE, AMEND_EVENT_MESSAGE_SIZE, CANCEL_EVENT_MESSAGE_SIZE, INSERT_EVENT_MESSAGE_SIZE,
+                LOGIN_EVENT_MESSAGE_SIZE, HEDGE_EVENT_MESSAGE_SIZE, TRADE_EVENT_MESSAGE_SIZE)
+_ARENA_TYPES = (MessageType.ERROR, MessageType.AMEND_EVENT, MessageType.CANCEL_EVENT, MessageType.INSERT_EVENT,
+                MessageType.LOGIN_EVENT, MessageType.HEDGE_EVENT, MessageType.TRADE_EVENT)
+_ARENA_OFFSETS = tuple(itertools.accumulate(_ARENA_SIZES, initial=0))
+
+
+def _build_arena_template() -> bytes:
+    template = bytearray(sum(_ARENA_SIZES))
+    for offset, size, typ in zip(_ARENA_OFFSETS, _ARENA_SIZES, _ARENA_TYPES):
+        HEADER.pack_into(template, offset, size, typ)
+    return bytes(template)
+
+
+_ARENA_TEMPLATE = _build_arena_template()
+
+
+def _pack_amend_event(buffer: bytearray, identifier: int, event: MatchEvent) -> None:
+    AMEND_EVENT_MESSAGE.pack_into(buffer, HEADER_SIZE, event.time, identifier, event.order_id, event.volume)
+
+
+def _pack_cancel_event(buffer: bytearray, identifier: int, event: MatchEvent) -> None:
+    CANCEL_EVENT_MESSAGE.pack_into(buffer, HEADER_SIZE, event.time, identifier, event.order_id)
+
+
+def _pack_insert_event(buffer: bytearray, identifier: int, event: MatchEvent) -> None:
+    INSERT_EVENT_MESSAGE.pack_into(buffer, HEADER_SIZE, event.time, identifier, event.order_id,
+                                   event.instrument.value, event.side.value, event.volume, event.price,
+                                   event.lifespan.value)
+
+
+def _pack_hedge_event(buffer: bytearray, identifier: int, event: MatchEvent) -> None:
+    HEDGE_EVENT_MESSAGE.pack_into(buffer, HEADER_SIZE, event.time, identifier, event.side, event.instrument,
+                                  event.volume, event.price)
+
+
+def _pack_trade_event(buffer: bytearray, identifier: int, event: MatchEvent) -> None:
+    TRADE_EVENT_MESSAGE.pack_into(buffer, HEADER_SIZE, event.time, identifier, event.order_id, event.side,
+                                  event.instrument, event.volume, event.price, event.fee)
+
+
 class HudConnection(Connection, IExecutionConnection):
+    __slots__ = ("__advance_time", "__arena", "__call_soon", "__competitor", "__competitor_manager", "__controller",
+                 "__dispatch", "__error_message", "__event_dispatch", "__flush_pending", "__logger",
+                 "__login_event_message", "__match_events", "__pending")
+
+    # Message type mapped to expected length, payload decoder and the name of
+    # the competitor callback; bound to the competitor instance at login.
+    _MESSAGE_HANDLERS = {
+        int(MessageType.AMEND_ORDER): (AMEND_MESSAGE_SIZE, AMEND_MESSAGE.unpack_from, "on_amend_message"),
+        int(MessageType.CANCEL_ORDER): (CANCEL_MESSAGE_SIZE, CANCEL_MESSAGE.unpack_from, "on_cancel_message"),
+        int(MessageType.INSERT_ORDER): (INSERT_MESSAGE_SIZE, INSERT_MESSAGE.unpack_from, "on_insert_message"),
+    }
+
     def __init__(self, match_events: MatchEvents, competitor_manager: CompetitorManager, controller: IController):
         """Initialise a new instance of the HudConnection class."""
         Connection.__init__(self)
 
+        self.__advance_time = controller.advance_time
         self.__competitor: Optional[ICompetitor] = None
-        self.__competitor_ids: Dict[str, int] = {"": 0}
         self.__competitor_manager: CompetitorManager = competitor_manager
         self.__controller: IController = controller
+        self.__dispatch = {}
         self.__logger = logging.getLogger("HEADS_UP")
         self.__match_events: MatchEvents = match_events
 
-        # Message buffers
-        self.__error_message = bytearray(ERROR_MESSAGE_SIZE)
-        self.__amend_event_message = bytearray(AMEND_EVENT_MESSAGE_SIZE)
-        self.__cancel_event_message = bytearray(CANCEL_EVENT_MESSAGE_SIZE)
-        self.__insert_event_message = bytearray(INSERT_EVENT_MESSAGE_SIZE)
-        self.__login_event_message = bytearray(LOGIN_EVENT_MESSAGE_SIZE)
-        self.__hedge_event_message = bytearray(HEDGE_EVENT_MESSAGE_SIZE)
-        self.__trade_event_message = bytearray(TRADE_EVENT_MESSAGE_SIZE)
-
-        HEADER.pack_into(self.__error_message, 0, ERROR_MESSAGE_SIZE, MessageType.ERROR)
-        HEADER.pack_into(self.__amend_event_message, 0, AMEND_EVENT_MESSAGE_SIZE, MessageType.AMEND_EVENT)
-        HEADER.pack_into(self.__cancel_event_message, 0, CANCEL_EVENT_MESSAGE_SIZE, MessageType.CANCEL_EVENT)
-        HEADER.pack_into(self.__insert_event_message, 0, INSERT_EVENT_MESSAGE_SIZE, MessageType.INSERT_EVENT)
-        HEADER.pack_into(self.__login_event_message, 0, LOGIN_EVENT_MESSAGE_SIZE, MessageType.LOGIN_EVENT)
-        HEADER.pack_into(self.__hedge_event_message, 0, HEDGE_EVENT_MESSAGE_SIZE, MessageType.HEDGE_EVENT)
-        HEADER.pack_into(self.__trade_event_message, 0, TRADE_EVENT_MESSAGE_SIZE, MessageType.TRADE_EVENT)
+        self.__call_soon = asyncio.get_running_loop().call_soon
+        self.__flush_pending: bool = False
+        self.__pending = bytearray()
+
+        # Message buffers: memoryview slices over one contiguous arena,
+        # copied from the module-level template with the headers prepacked
+        self.__arena = memoryview(bytearray(_ARENA_TEMPLATE))
+        (error_view, amend_view, cancel_view, insert_view, login_view, hedge_view, trade_view) = (
+            self.__arena[_ARENA_OFFSETS[i]:_ARENA_OFFSETS[i + 1]] for i in range(len(_ARENA_SIZES)))
+
+        self.__error_message = error_view
+        self.__login_event_message = login_view
+
+        # Packer and buffer for each match event operation, indexed by the
+        # operation value; the event buffers are only ever reached this way
+        self.__event_dispatch = [(_pack_amend_event, amend_view),
+                                 (_pack_cancel_event, cancel_view),
+                                 (_pack_insert_event, insert_view),
+                                 (_pack_hedge_event, hedge_view),
+                                 (_pack_trade_event, trade_view)]
 
     def connection_lost(self, exc: Optional[Exception]) -> None:
         """Called when the connection to the heads-up display is lost."""
@@ -74,12 +136,12 @@ class HudConnection(Connection, IExecutionConnection):
         self.__competitor_manager.on_competitor_connect()
         self.__competitor_manager.competitor_logged_in.append(self.on_competitor_logged_in)
         for competitor in self.__competitor_manager.get_competitors():
-            self.on_competitor_logged_in(competitor.name)
+            self.on_competitor_logged_in(competitor.name, competitor.identifier)
         self.__match_events.event_occurred.append(self.on_match_event)
 
     def on_message(self, typ: int, data: bytes, start: int, length: int) -> None:
         """Callback when a message is received from the Heads-Up Display."""
-        now: float = self.__controller.advance_time()
+        now: float = self.__advance_time()
 
         if self.__competitor is None:
             if typ == MessageType.LOGIN and length == LOGIN_MESSAGE_SIZE:
@@ -90,53 +152,56 @@ class HudConnection(Connection, IExecutionConnection):
                 self._connection_transport.close()
             return
 
-        if typ == MessageType.AMEND_ORDER and length == AMEND_MESSAGE_SIZE:
-            self.__competitor.on_amend_message(now, *AMEND_MESSAGE.unpack_from(data, start))
-        elif typ == MessageType.CANCEL_ORDER and length == CANCEL_MESSAGE_SIZE:
-            self.__competitor.on_cancel_message(now, *CANCEL_MESSAGE.unpack_from(data, start))
-        elif typ == MessageType.INSERT_ORDER and length == INSERT_MESSAGE_SIZE:
-            self.__competitor.on_insert_message(now, *INSERT_MESSAGE.unpack_from(data, start))
+        entry = self.__dispatch.get(typ)
+        if entry is not None and length == entry[0]:
+            entry[2](now, *entry[1](data, start))
         else:
             self.__logger.warning("fd=%d '%s' received invalid message: time=%.6f length=%d type=%d",
                                   self._file_number, length, typ)
             self.close()
 
-    def on_competitor_logged_in(self, name: str) -> None:
+    def __flush(self) -> None:
+        """Write out the events accumulated during this event-loop iteration."""
+        self.__flush_pending = False
+        if not self.__pending:
+            return
+        transport = self._connection_transport
+        if transport is not None and not transport.is_closing():
+            transport.write(self.__pending)
+        self.__pending.clear()
+
+    def __queue_write(self, data) -> None:
+        """Append an outbound message to the pending buffer.
+
+        A burst of match events within one event-loop iteration goes out as
+        a single transport write; the buffer is flushed early if it grows
+        beyond 64KiB.
+        """
+        pending = self.__pending
+        pending += data
+        if len(pending) >= 65536:
+            self.__flush()
+        elif not self.__flush_pending:
+            self.__flush_pending = True
+            self.__call_soon(self.__flush)
+
+    def on_competitor_logged_in(self, name: str, identifier: int) -> None:
         """Called when a competitor logs in."""
-        identifier = self.__competitor_ids[name] = len(self.__competitor_ids) + 1
         LOGIN_EVENT_MESSAGE.pack_into(self.__login_event_message, HEADER_SIZE, name.encode(), identifier)
-        self._connection_transport.write(self.__login_event_message)
+        self.__queue_write(self.__login_event_message)
 
     def on_login(self, name: str, secret: str) -> None:
         """Called when the heads-up display logs in."""
         self.__competitor = self.__competitor_manager.login_competitor(name, secret, self)
+        if self.__competitor is not None:
+            self.__dispatch = {typ: (size, unpack, getattr(self.__competitor, attr))
+                               for typ, (size, unpack, attr) in self._MESSAGE_HANDLERS.items()}
 
     def on_match_event(self, event: MatchEvent) -> None:
         """Called when a match event occurs."""
-        if event.operation == MatchEventOperation.AMEND:
-            AMEND_EVENT_MESSAGE.pack_into(self.__amend_event_message, HEADER_SIZE, event.time,
-                                          self.__competitor_ids[event.competitor], event.order_id, event.volume)
-            self._connection_transport.write(self.__amend_event_message)
-        elif event.operation == MatchEventOperation.CANCEL:
-            CANCEL_EVENT_MESSAGE.pack_into(self.__cancel_event_message, HEADER_SIZE, event.time,
-                                           self.__competitor_ids[event.competitor], event.order_id)
-            self._connection_transport.write(self.__cancel_event_message)
-        elif event.operation == MatchEventOperation.INSERT:
-            INSERT_EVENT_MESSAGE.pack_into(self.__insert_event_message, HEADER_SIZE, event.time,
-                                           self.__competitor_ids[event.competitor], event.order_id,
-                                           event.instrument.value, event.side.value, event.volume, event.price,
-                                           event.lifespan.value)
-            self._connection_transport.write(self.__insert_event_message)
-        elif event.operation == MatchEventOperation.HEDGE:
-            HEDGE_EVENT_MESSAGE.pack_into(self.__hedge_event_message, HEADER_SIZE, event.time,
-                                          self.__competitor_ids[event.competitor], event.side, event.instrument,
-                                          event.volume, event.price)
-            self._connection_transport.write(self.__hedge_event_message)
-        elif event.operation == MatchEventOperation.TRADE:
-            TRADE_EVENT_MESSAGE.pack_into(self.__trade_event_message, HEADER_SIZE, event.time,
-                                          self.__competitor_ids[event.competitor], event.order_id,
-                                          event.side, event.instrument, event.volume, event.price, event.fee)
-            self._connection_transport.write(self.__trade_event_message)
+        packer, buffer = self.__event_dispatch[event.operation]
+        packer(buffer, event.competitor_id, event)
+        self.__queue_write(buffer)
 
     # IExecutionConnection overrides
 
@@ -147,7 +212,8 @@ class HudConnection(Connection, IExecutionConnection):
     def send_error(self, client_order_id: int, error_message: bytes) -> None:
         """Send an error message to the heads-up display."""
         ERROR_MESSAGE.pack_into(self.__error_message, HEADER_SIZE, client_order_id, error_message)
-        self._connection_transport.write(self.__error_message)
+        self.__queue_write(self.__error_message)
+        self.__flush()
 
     def send_order_filled(self, client_order_id: int, price: int, volume: int) -> None:
         """Send an order filled message to the heads-up display."""
@@ -159,6 +225,8 @@ class HudConnection(Connection, IExecutionConnection):
 
 
 class HeadsUpDisplayServer:
+    __slots__ = ("host", "port", "__competitor_manager", "__controller", "__logger", "__match_events", "__server")
+
     def __init__(self, host: str, port: int, match_events: MatchEvents, competitor_manager: CompetitorManager,
                  controller: IController):
         """Initialise a new instance of the HeadsUpDisplayServer class."""
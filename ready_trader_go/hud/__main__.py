@@ -16,16 +16,16 @@
 #     License along with Ready Trader Go.  If not, see
 #     <https://www.gnu.org/licenses/>.
 import configparser
+import functools
 import json
 import os
 import pathlib
 import string
 import sys
-import time
 
 from typing import Any, Mapping, Tuple
 
-from PySide6 import QtGui, QtWidgets
+from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtCore import Qt
 
 from .event_source import EventSource, LiveEventSource, RecordedEventSource
@@ -43,20 +43,41 @@ def __create_application() -> QtWidgets.QApplication:
     #     os.environ["QT_MAC_WANTS_LAYER"] = "1"
     app = QtWidgets.QApplication(sys.argv)
     app.setStyle(QtWidgets.QStyleFactory.create("Fusion"))
-    with (HERE.joinpath("style/style.qss")).open("r") as theme:
-        with (HERE.joinpath("style/settings.ini")).open("r") as settings:
-            parser = configparser.ConfigParser()
-            parser.read_file(settings)
-            template = string.Template(theme.read())
-            app.setStyleSheet(template.substitute(parser["default"]))
+    app.setStyleSheet(__load_style_sheet())
     return app
 
 
+def __load_style_sheet() -> str:
+    style_path = HERE.joinpath("style/style.qss")
+    settings_path = HERE.joinpath("style/settings.ini")
+    baked_path = HERE.joinpath("style/style.baked.qss")
+
+    # Use the style sheet baked on a previous launch unless either of its
+    # sources has changed since
+    try:
+        if baked_path.stat().st_mtime >= max(style_path.stat().st_mtime, settings_path.stat().st_mtime):
+            return baked_path.read_text()
+    except OSError:
+        pass
+
+    parser = configparser.ConfigParser()
+    with settings_path.open("r") as settings:
+        parser.read_file(settings)
+    style_sheet = string.Template(style_path.read_text()).substitute(parser["default"])
+
+    try:
+        baked_path.write_text(style_sheet)
+    except OSError:
+        pass  # Read-only install; bake again next launch
+
+    return style_sheet
+
+
+@functools.lru_cache(maxsize=1)
 def __read_exchange_config() -> Tuple[float, float]:
     config_path = pathlib.Path(EXCHANGE_CONFIG_PATH)
     if config_path.exists():
-        with config_path.open("r") as config:
-            config = json.load(config)
+        config = json.loads(config_path.read_bytes())
         if not __validate_configuration(config_path, config):
             raise Exception("configuration failed validation: %s" % config_path.resolve())
         return config["Instrument"]["EtfClamp"], config["Instrument"]["TickSize"]
@@ -115,7 +136,15 @@ def main(host: str, port: int):
     app = __create_application()
     splash = __show_splash()
     etf_clamp, tick_size = __read_exchange_config()
-    time.sleep(1)
-    event_source = LiveEventSource(host, port, etf_clamp, tick_size)
-    window = __show_main_window(splash, event_source)
+
+    # Give the exchange simulator a moment to come up without blocking the
+    # GUI thread; the reference to the window keeps it alive
+    window = None
+
+    def show_window() -> None:
+        nonlocal window
+        event_source = LiveEventSource(host, port, etf_clamp, tick_size)
+        window = __show_main_window(splash, event_source)
+
+    QtCore.QTimer.singleShot(1000, show_window)
     return app.exec_()
@@ -16,9 +16,10 @@
 #     License along with Ready Trader Go.  If not, see
 #     <https://www.gnu.org/licenses/>.
 import collections
-import sys
+import math
+import os
 
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional, Set
 
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6 import QtCharts
@@ -27,6 +28,20 @@ from PySide6.QtCore import Qt
 from ready_trader_go.types import Instrument
 
 CHART_DURATION: float = 60.0
+REFRESH_INTERVAL_MILLISECONDS: int = 33
+
+# Set RTG_CHART_OPENGL=0 to fall back to the CPU raster path on machines
+# whose GL drivers cannot create a context
+USE_OPENGL: bool = os.environ.get("RTG_CHART_OPENGL", "1") != "0"
+
+
+def _prune(points: Deque[QtCore.QPointF]) -> Deque[QtCore.QPointF]:
+    """Discard points that have scrolled out of the visible window."""
+    if points:
+        cutoff: float = points[-1].x() - CHART_DURATION
+        while points[0].x() < cutoff:
+            points.popleft()
+    return points
 
 
 class BaseChartGadget(QtWidgets.QWidget):
@@ -63,9 +78,33 @@ class BaseChartGadget(QtWidgets.QWidget):
         self._style_axes()
 
         self._largest_y_value: float = 0.0
-        self._smallest_y_value: float = sys.float_info.max
+        self._smallest_y_value: float = math.inf
         self.__x_axis_maximum: float = 0.0
 
+        self.__y_axis_dirty: bool = False
+
+        # Incoming points are buffered and pushed to the chart at most once
+        # per refresh interval so a burst of events costs one repaint
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setInterval(REFRESH_INTERVAL_MILLISECONDS)
+        self._refresh_timer.timeout.connect(self.__on_refresh)
+
+    def __on_refresh(self) -> None:
+        """Apply any deferred axis change, then push buffered points."""
+        if self.__y_axis_dirty:
+            self.__y_axis_dirty = False
+            self.chart.axisY().setRange(self._smallest_y_value - 0.01, self._largest_y_value + 0.01)
+        self._refresh()
+
+    def _refresh(self) -> None:
+        """Push buffered points to the chart."""
+        raise NotImplementedError()
+
+    def _request_refresh(self) -> None:
+        """Ensure a refresh happens within the refresh interval."""
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
     def _style_axes(self):
         """Apply the common style elements to the chart axes."""
         chart: QtCharts.QChart = self.chart
@@ -82,13 +121,17 @@ class BaseChartGadget(QtWidgets.QWidget):
             self.chart.scroll(scroll_distance * self.chart.plotArea().width() / CHART_DURATION, 0)
 
     def _update_y_axis(self, new_value: float) -> None:
-        """Ensure the y-axis range is large enough for the given value."""
-        if new_value < self._smallest_y_value:
-            self.chart.axisY().setMin(new_value - 0.01)
-            self._smallest_y_value = new_value
-        if new_value > self._largest_y_value:
-            self.chart.axisY().setMax(new_value + 0.01)
-            self._largest_y_value = new_value
+        """Ensure the y-axis range is large enough for the given value.
+
+        The axis itself is only touched on the next refresh; setting its
+        range synchronously repaints the chart.
+        """
+        smallest = min(self._smallest_y_value, new_value)
+        largest = max(self._largest_y_value, new_value)
+        if smallest != self._smallest_y_value or largest != self._largest_y_value:
+            self._smallest_y_value = smallest
+            self._largest_y_value = largest
+            self.__y_axis_dirty = True
 
 
 class MidpointChartGadget(BaseChartGadget):
@@ -102,14 +145,18 @@ class MidpointChartGadget(BaseChartGadget):
 
         self.setWindowTitle("Midpoint Prices")
 
-        self.instrument_series: List[QtCharts.QSplineSeries] = [QtCharts.QSplineSeries() for _ in Instrument]
+        self.instrument_series: List[QtCharts.QLineSeries] = [QtCharts.QLineSeries() for _ in Instrument]
         for i, line_series in enumerate(self.instrument_series):
             line_series.setName(Instrument(i).name)
+            line_series.setUseOpenGL(USE_OPENGL)
             self.chart.addSeries(line_series)
             line_series.attachAxis(self.chart.axisX())
             line_series.attachAxis(self.chart.axisY())
             line_series.setColor(self._COLOURS[i])
 
+        self.__dirty: List[bool] = [False for _ in Instrument]
+        self.__points: List[Deque[QtCore.QPointF]] = [collections.deque() for _ in Instrument]
+
         self.__last_price: Optional[float] = None
         self.__timer = QtCore.QTimer(self)
         self.__timer.timeout.connect(self.__on_timer_tick)
@@ -125,12 +172,21 @@ class MidpointChartGadget(BaseChartGadget):
                 self._smallest_y_value += delta
             self.chart.axisY().setRange(self._smallest_y_value, self._largest_y_value)
 
+    def _refresh(self) -> None:
+        """Push buffered points to the chart."""
+        for i, line_series in enumerate(self.instrument_series):
+            if self.__dirty[i]:
+                self.__dirty[i] = False
+                line_series.replace(list(_prune(self.__points[i])))
+
     def on_midpoint_price_changed(self, instrument: Instrument, time: float, mid_price: float) -> None:
         """Callback when the midpoint price of an instrument changes."""
         self._scroll_x_axis(time)
         price = mid_price / 100.0
         self._update_y_axis(price)
-        self.instrument_series[instrument].append(time, price)
+        self.__points[instrument].append(QtCore.QPointF(time, price))
+        self.__dirty[instrument] = True
+        self._request_refresh()
         self.__last_price = price
         if not self.__timer.isActive():
             self.__timer.start(6000)
@@ -146,20 +202,37 @@ class ProfitLossChartGadget(BaseChartGadget):
         super().__init__(parent)
 
         self.setWindowTitle("All Teams Profit or Loss")
-        self.team_series: Dict[str, QtCharts.QSplineSeries] = collections.defaultdict(QtCharts.QSplineSeries)
+        self.team_series: Dict[str, QtCharts.QLineSeries] = dict()
+
+        self.__dirty: Set[str] = set()
+        self.__points: Dict[str, Deque[QtCore.QPointF]] = collections.defaultdict(collections.deque)
 
     def on_login_occurred(self, team: str) -> None:
         """Callback when a team logs in to the exchange."""
-        line_series: QtCharts.QSplineSeries = self.team_series[team]
+        line_series = QtCharts.QLineSeries()
+        line_series.setUseOpenGL(USE_OPENGL)
+        self.team_series[team] = line_series
         self.chart.addSeries(line_series)
         line_series.attachAxis(self.chart.axisX())
         line_series.attachAxis(self.chart.axisY())
         line_series.setName(team)
         line_series.setColor(self._COLOURS[(len(self.team_series) - 1) % len(self._COLOURS)])
 
+    def _refresh(self) -> None:
+        """Push buffered points to the chart."""
+        for team in self.__dirty:
+            self.team_series[team].replace(list(_prune(self.__points[team])))
+        self.__dirty.clear()
+
     def on_profit_loss_changed(self, team: str, time: float, profit: float, etf_position: int,
                                account_balance: float, total_fees: float) -> None:
         """Callback when the profit of a team changes."""
+        if team not in self.team_series:
+            # Ignore events for teams that have not logged in; indexing a
+            # defaultdict here used to silently create an orphaned series
+            return
         self._update_y_axis(profit)
-        self.team_series[team].append(time, profit)
+        self.__points[team].append(QtCore.QPointF(time, profit))
+        self.__dirty.add(team)
+        self._request_refresh()
         self._scroll_x_axis(time)
@@ -15,17 +15,18 @@
 #     You should have received a copy of the GNU Affero General Public
 #     License along with Ready Trader Go.  If not, see
 #     <https://www.gnu.org/licenses/>.
+import bisect
 import collections
 import csv
 import itertools
 
-from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Set, TextIO, Tuple
+from typing import Callable, Dict, List, Optional, Set, TextIO, Tuple
 
 from PySide6 import QtCore,  QtNetwork
 
 from ready_trader_go.account import AccountFactory, CompetitorAccount
 from ready_trader_go.messages import (AMEND_EVENT_MESSAGE, AMEND_EVENT_MESSAGE_SIZE, CANCEL_EVENT_MESSAGE,
-                                      CANCEL_EVENT_MESSAGE_SIZE, ERROR_MESSAGE, ERROR_MESSAGE_SIZE, HEADER_SIZE,
+                                      CANCEL_EVENT_MESSAGE_SIZE, ERROR_MESSAGE, ERROR_MESSAGE_SIZE, HEADER, HEADER_SIZE,
                                       HEDGE_EVENT_MESSAGE, HEDGE_EVENT_MESSAGE_SIZE, INSERT_EVENT_MESSAGE,
                                       INSERT_EVENT_MESSAGE_SIZE, LOGIN_EVENT_MESSAGE, LOGIN_EVENT_MESSAGE_SIZE,
                                       TRADE_EVENT_MESSAGE, TRADE_EVENT_MESSAGE_SIZE, MessageType)
@@ -39,6 +40,12 @@ __all__ = ("EventSource", "LiveEventSource", "RecordedEventSource")
 TICK_INTERVAL_MILLISECONDS = 500
 TICK_INTERVAL_SECONDS = TICK_INTERVAL_MILLISECONDS / 1000.0
 
+# Enum members by value; a tuple index is cheaper than the enum constructor
+# on the per-message paths
+_INSTRUMENTS = tuple(Instrument)
+_LIFESPANS = tuple(Lifespan)
+_SIDES = tuple(Side)
+
 
 class EventSource(QtCore.QObject):
     """A source of events for the Ready Trader Go HUD to display."""
@@ -98,6 +105,9 @@ class LiveEventSource(EventSource):
         self.port: int = port
 
         self.__accounts: Dict[int, CompetitorAccount] = dict()
+        # (team, account) pairs for the per-tick P&L loop, maintained at
+        # login so the tick avoids dict iteration and the id-to-name lookup
+        self.__account_items: List[Tuple[str, CompetitorAccount]] = list()
         self.__now: float = 0.0
         self.__order_books: List[OrderBook] = list(OrderBook(i, 0.0, 0.0) for i in Instrument)
         self.__orders: Dict[int, Dict[int, Order]] = {0: dict()}
@@ -114,7 +124,34 @@ class LiveEventSource(EventSource):
         self.__socket.disconnected.connect(self.on_disconnected)
         self.__socket.errorOccurred.connect(self.on_error_occurred)
         self.__socket.readyRead.connect(self.on_data_received)
-        self.__stream = QtCore.QDataStream(self.__socket)
+        self.__receive_buffer = bytearray()
+
+        # Bound signal emitters for the per-event and per-tick paths
+        self.__emit_midpoint = self.midpoint_price_changed.emit
+        self.__emit_order_amended = self.order_amended.emit
+        self.__emit_order_book = self.order_book_changed.emit
+        self.__emit_order_cancelled = self.order_cancelled.emit
+        self.__emit_order_inserted = self.order_inserted.emit
+        self.__emit_trade = self.trade_occurred.emit
+
+        # Message type mapped to expected length, payload decoder and handler.
+        # Login and error events go through wrappers that trim their text
+        # fields, keeping the receive path uniform.
+        self.__message_handlers = {
+            int(MessageType.LOGIN_EVENT): (LOGIN_EVENT_MESSAGE_SIZE, LOGIN_EVENT_MESSAGE.unpack_from,
+                                           self.__on_raw_login_event),
+            int(MessageType.ERROR): (ERROR_MESSAGE_SIZE, ERROR_MESSAGE.unpack_from, self.__on_raw_error),
+            int(MessageType.AMEND_EVENT): (AMEND_EVENT_MESSAGE_SIZE, AMEND_EVENT_MESSAGE.unpack_from,
+                                           self.on_amend_event_message),
+            int(MessageType.CANCEL_EVENT): (CANCEL_EVENT_MESSAGE_SIZE, CANCEL_EVENT_MESSAGE.unpack_from,
+                                            self.on_cancel_event_message),
+            int(MessageType.INSERT_EVENT): (INSERT_EVENT_MESSAGE_SIZE, INSERT_EVENT_MESSAGE.unpack_from,
+                                            self.on_insert_event_message),
+            int(MessageType.HEDGE_EVENT): (HEDGE_EVENT_MESSAGE_SIZE, HEDGE_EVENT_MESSAGE.unpack_from,
+                                           self.on_hedge_event_message),
+            int(MessageType.TRADE_EVENT): (TRADE_EVENT_MESSAGE_SIZE, TRADE_EVENT_MESSAGE.unpack_from,
+                                           self.on_trade_event_message),
+        }
 
     def __del__(self) -> None:
         """Destructor."""
@@ -135,36 +172,38 @@ class LiveEventSource(EventSource):
 
     def on_data_received(self) -> None:
         """Callback when data is received from the exchange simulator."""
-        while True:
-            self.__stream.startTransaction()
-            length: int = self.__stream.readUInt16()
-            typ: int = self.__stream.readUInt8()
-            data: bytes = self.__stream.readRawData(length - HEADER_SIZE)
-            if not self.__stream.commitTransaction():
-                return
-            self.on_message(typ, data, length)
-
-    def on_message(self, typ: int, data: bytes, length: int):
+        buffer = self.__receive_buffer
+        buffer += self.__socket.readAll().data()
+
+        read_off: int = 0
+        upto: int = len(buffer)
+        header_unpack = HEADER.unpack_from
+        on_message = self.on_message
+
+        while upto - read_off >= HEADER_SIZE:
+            length, typ = header_unpack(buffer, read_off)
+            if read_off + length > upto:
+                break
+            on_message(typ, buffer, read_off + HEADER_SIZE, length)
+            read_off += length
+
+        if read_off:
+            del buffer[:read_off]
+
+    def on_message(self, typ: int, data: bytearray, start: int, length: int):
         """Process a message."""
-        if typ == MessageType.AMEND_EVENT and length == AMEND_EVENT_MESSAGE_SIZE:
-            self.on_amend_event_message(*AMEND_EVENT_MESSAGE.unpack_from(data))
-        elif typ == MessageType.CANCEL_EVENT and length == CANCEL_EVENT_MESSAGE_SIZE:
-            self.on_cancel_event_message(*CANCEL_EVENT_MESSAGE.unpack_from(data))
-        elif typ == MessageType.INSERT_EVENT and length == INSERT_EVENT_MESSAGE_SIZE:
-            self.on_insert_event_message(*INSERT_EVENT_MESSAGE.unpack_from(data))
-        elif typ == MessageType.LOGIN_EVENT and length == LOGIN_EVENT_MESSAGE_SIZE:
-            name, competitor_id = LOGIN_EVENT_MESSAGE.unpack_from(data)
-            self.on_login_event_message(name.rstrip(b"\0").decode(), competitor_id)
-        elif typ == MessageType.HEDGE_EVENT and length == HEDGE_EVENT_MESSAGE_SIZE:
-            self.on_hedge_event_message(*HEDGE_EVENT_MESSAGE.unpack_from(data))
-        elif typ == MessageType.TRADE_EVENT and length == TRADE_EVENT_MESSAGE_SIZE:
-            self.on_trade_event_message(*TRADE_EVENT_MESSAGE.unpack_from(data))
-        elif typ == MessageType.ERROR and length == ERROR_MESSAGE_SIZE:
-            client_order_id, error_message = ERROR_MESSAGE.unpack_from(data)
-            self.on_error_message(client_order_id, error_message.rstrip(b"\x00"))
+        entry = self.__message_handlers.get(typ)
+        if entry is not None and length == entry[0]:
+            entry[2](*entry[1](data, start))
         else:
             self.event_source_error_occurred.emit("received invalid message: length=%d type=%d" % (length, typ))
 
+    def __on_raw_login_event(self, name: bytes, competitor_id: int) -> None:
+        self.on_login_event_message(name.rstrip(b"\0").decode(), competitor_id)
+
+    def __on_raw_error(self, client_order_id: int, error_message: bytes) -> None:
+        self.on_error_message(client_order_id, error_message.rstrip(b"\x00"))
+
     def on_error_message(self, client_order_id: int, error_message: bytes):
         """Callback when an error message is received."""
 
@@ -177,7 +216,7 @@ class LiveEventSource(EventSource):
             if order.remaining_volume == 0:
                 del self.__orders[competitor_id][order_id]
         if competitor_id != 0:
-            self.order_amended.emit(self.__teams[competitor_id], now, order_id, volume_delta)
+            self.__emit_order_amended(self.__teams[competitor_id], now, order_id, volume_delta)
 
     def on_cancel_event_message(self, now: float, competitor_id: int, order_id: int) -> None:
         """Callback when an cancel event message is received."""
@@ -186,28 +225,30 @@ class LiveEventSource(EventSource):
         if order is not None:
             self.__order_books[order.instrument].cancel(now, order)
         if competitor_id != 0:
-            self.order_cancelled.emit(self.__teams[competitor_id], now, order_id)
+            self.__emit_order_cancelled(self.__teams[competitor_id], now, order_id)
 
     def on_insert_event_message(self, now: float, competitor_id: int, order_id: int, instrument: int, side: int,
                                 volume: int, price: int, lifespan: int) -> None:
         """Callback when an insert event message is received."""
         self.__now = now
-        order = Order(order_id, Instrument(instrument), Lifespan(lifespan), Side(side), price, volume)
+        order = Order(order_id, _INSTRUMENTS[instrument], _LIFESPANS[lifespan], _SIDES[side], price, volume)
         self.__orders[competitor_id][order_id] = order
         self.__order_books[instrument].insert(now, order)
         if competitor_id != 0:
-            self.order_inserted.emit(self.__teams[competitor_id], now, order_id, Instrument(instrument),
-                                     Side(side), volume, price, Lifespan(lifespan))
+            self.__emit_order_inserted(self.__teams[competitor_id], now, order_id, order.instrument,
+                                       order.side, volume, price, order.lifespan)
 
     def on_hedge_event_message(self, now: float, competitor_id: int, side: int, instrument: int, volume: int,
                                price: float) -> None:
         """Callback when an hedge event message is received."""
         self.__now = now
-        self.__accounts[competitor_id].transact(Instrument(instrument), Side(side), price, volume, 0)
+        self.__accounts[competitor_id].transact(_INSTRUMENTS[instrument], _SIDES[side], price, volume, 0)
 
     def on_login_event_message(self, name: str, competitor_id: int) -> None:
         """Callback when an login event message is received."""
-        self.__accounts[competitor_id] = self._account_factory.create()
+        account = self._account_factory.create()
+        self.__accounts[competitor_id] = account
+        self.__account_items.append((name, account))
         self.__teams[competitor_id] = name
         self.__orders[competitor_id] = dict()
         self.login_occurred.emit(name)
@@ -220,23 +261,24 @@ class LiveEventSource(EventSource):
         for i in Instrument:
             midpoint_price: float = self.__order_books[i].midpoint_price()
             if midpoint_price is not None:
-                self.midpoint_price_changed.emit(i, self.__now, midpoint_price)
+                self.__emit_midpoint(i, self.__now, midpoint_price)
                 self.__order_books[i].top_levels(self.__ask_prices, self.__ask_volumes, self.__bid_prices,
                                                  self.__bid_volumes)
-                self.order_book_changed.emit(i, self.__now, self.__ask_prices, self.__ask_volumes,
-                                             self.__bid_prices, self.__bid_volumes)
+                self.__emit_order_book(i, self.__now, self.__ask_prices, self.__ask_volumes,
+                                       self.__bid_prices, self.__bid_volumes)
 
         future_price: int = self.__order_books[Instrument.FUTURE].last_traded_price()
         etf_price: int = self.__order_books[Instrument.ETF].last_traded_price()
         if future_price is None:
             future_price = round(self.__order_books[Instrument.FUTURE].midpoint_price())
         if future_price is not None and etf_price is not None:
-            for competitor_id, account in self.__accounts.items():
+            now = self.__now
+            emit_profit_loss = self.profit_loss_changed.emit
+            for team, account in self.__account_items:
                 account.update(future_price, etf_price)
-                self.profit_loss_changed.emit(self.__teams[competitor_id], self.__now,
-                                              account.profit_or_loss / 100.0, account.etf_position,
-                                              account.future_position, account.account_balance / 100.0,
-                                              account.total_fees / 100.0)
+                emit_profit_loss(team, now, account.profit_or_loss * 0.01, account.etf_position,
+                                 account.future_position, account.account_balance * 0.01,
+                                 account.total_fees * 0.01)
 
         if self.__stop_later:
             self._timer.stop()
@@ -246,8 +288,9 @@ class LiveEventSource(EventSource):
                                volume: int, price: int, fee: int) -> None:
         """Callback when an trade event message is received."""
         self.__now = now
-        self.__accounts[competitor_id].transact(Instrument(instrument), Side(side), price, volume, fee)
-        self.trade_occurred.emit(self.__teams[competitor_id], now, order_id, Side(side), volume, price, fee)
+        side_ = _SIDES[side]
+        self.__accounts[competitor_id].transact(_INSTRUMENTS[instrument], side_, price, volume, fee)
+        self.__emit_trade(self.__teams[competitor_id], now, order_id, side_, volume, price, fee)
 
         order = self.__orders[competitor_id].get(order_id)
         if order and order.remaining_volume == 0:
@@ -258,13 +301,6 @@ class LiveEventSource(EventSource):
         self.__socket.connectToHost(self.host, self.port)
 
 
-class Event(NamedTuple):
-    """A recorded event."""
-    when: float
-    emitter: Callable
-    args: Tuple
-
-
 class RecordedEventSource(EventSource):
     """A source of events taken from a recording of a match."""
 
@@ -273,32 +309,38 @@ class RecordedEventSource(EventSource):
         super().__init__(etf_clamp, tick_size, parent)
 
         self.__teams: Set[str] = set()
+        self.__emit_order_book = self.order_book_changed.emit
         self.__end_time: float = 0.0
-        self.__events: List[Event] = list()
-        self.__event_iter: Optional[Iterator] = None
-        self.__next_event: Optional[Event] = None
         self.__now: float = 0.0
+
+        # Recorded events in struct-of-arrays form: parallel lists of
+        # timestamp, signal emitter and emitter arguments, with a cursor
+        # marking how far playback has progressed
+        self.__event_whens: List[float] = list()
+        self.__event_emitters: List[Callable] = list()
+        self.__event_args: List[Tuple] = list()
+        self.__event_cursor: int = 0
         self.__order_books: Tuple[List[int], ...] = tuple(list() for _ in Instrument)
 
     def _on_timer_tick(self):
         """Callback when the timer ticks."""
         now = self.__now = self.__now + TICK_INTERVAL_SECONDS
 
-        if self.__next_event.when <= now:
-            self.__next_event.emitter(*self.__next_event.args)
-            event: Optional[Event] = None
-            for event in self.__event_iter:
-                if event.when > now:
-                    break
-                event.emitter(*event.args)
-            self.__next_event = event
+        cursor: int = self.__event_cursor
+        end: int = bisect.bisect_right(self.__event_whens, now, cursor)
+        if end > cursor:
+            emitters = self.__event_emitters
+            args = self.__event_args
+            for k in range(cursor, end):
+                emitters[k](*args[k])
+            self.__event_cursor = end
 
         tick = int(now // TICK_INTERVAL_SECONDS)
         for i in Instrument:
             if len(self.__order_books[i]) >= (tick + 1) * 4 * TOP_LEVEL_COUNT:
                 data = (self.__order_books[i][j * TOP_LEVEL_COUNT:(j + 1) * TOP_LEVEL_COUNT]
                         for j in range(tick * 4, (tick + 1) * 4))
-                self.order_book_changed.emit(i, now, *data)
+                self.__emit_order_book(i, now, *data)
 
         if self.__now >= self.__end_time:
             self._timer.stop()
@@ -309,7 +351,15 @@ class RecordedEventSource(EventSource):
                  parent: Optional[QtCore.QObject] = None):
         """Create a new RecordedEventSource instance from a CSV file."""
         source = RecordedEventSource(etf_clamp, tick_size, parent)
-        events = source.__events
+
+        whens_append = source.__event_whens.append
+        emitters_append = source.__event_emitters.append
+        args_append = source.__event_args.append
+
+        def record(when: float, emitter: Callable, args: Tuple) -> None:
+            whens_append(when)
+            emitters_append(emitter)
+            args_append(args)
 
         reader = csv.reader(file_object)
         next(reader)  # Skip header
@@ -325,7 +375,7 @@ class RecordedEventSource(EventSource):
 
         def take_snapshot(when: float):
             for i in Instrument:
-                events.append(Event(when, source.midpoint_price_changed.emit, (i, when, books[i].midpoint_price())))
+                record(when, source.midpoint_price_changed.emit, (i, when, books[i].midpoint_price()))
                 books[i].top_levels(ask_prices, ask_volumes, bid_prices, bid_volumes)
                 source.__order_books[i].extend(itertools.chain(ask_prices, ask_volumes, bid_prices, bid_volumes))
 
@@ -334,10 +384,18 @@ class RecordedEventSource(EventSource):
             if future_price is not None and etf_price is not None:
                 for team, account in accounts.items():
                     account.update(future_price, etf_price)
-                    events.append(Event(when, source.profit_loss_changed.emit,
-                                        (team, when, account.profit_or_loss / 100.0, account.etf_position,
-                                         account.future_position, account.account_balance / 100.0,
-                                         account.total_fees / 100.0)))
+                    record(when, source.profit_loss_changed.emit,
+                           (team, when, account.profit_or_loss / 100.0, account.etf_position,
+                            account.future_position, account.account_balance / 100.0,
+                            account.total_fees / 100.0))
+
+        # Hoist the per-row lookups out of the parse loop; a recording can
+        # easily run to hundreds of thousands of rows.
+        teams: Set[str] = source.__teams
+        order_inserted = source.order_inserted.emit
+        order_amended = source.order_amended.emit
+        order_cancelled = source.order_cancelled.emit
+        trade_occurred = source.trade_occurred.emit
 
         now: float = TICK_INTERVAL_SECONDS
         for row in reader:
@@ -351,31 +409,30 @@ class RecordedEventSource(EventSource):
             order_id: int = int(row[3])
             operation: str = row[2]
 
-            if team and team not in source.__teams:
-                source.__teams.add(team)
+            if team:
+                teams.add(team)
 
             if operation == "Insert":
-                order = Order(order_id, Instrument(int(row[4])), Lifespan[row[8]], Side[row[5]],
+                order = Order(order_id, _INSTRUMENTS[int(row[4])], Lifespan[row[8]], Side[row[5]],
                               int(row[7]), int(row[6]))
                 books[order.instrument].insert(tm, order)
                 orders[team][order_id] = order
-                events.append(Event(tm, source.order_inserted.emit, (team, tm, order_id, order.instrument,
-                                                                     order.side, order.volume, order.price,
-                                                                     order.lifespan)))
+                record(tm, order_inserted, (team, tm, order_id, order.instrument, order.side, order.volume,
+                                            order.price, order.lifespan))
             elif operation == "Amend":
                 order = orders[team][order_id]
                 volume_delta = int(row[6])
                 books[order.instrument].amend(tm, order, order.volume + volume_delta)
                 if order.remaining_volume == 0:
                     del orders[team][order_id]
-                events.append(Event(tm, source.order_amended.emit, (team, tm, order_id, volume_delta)))
+                record(tm, order_amended, (team, tm, order_id, volume_delta))
             elif operation == "Cancel":
                 order = orders[team].pop(order_id, None)
                 if order:
                     books[order.instrument].cancel(tm, order)
-                events.append(Event(tm, source.order_cancelled.emit, (team, tm, order_id)))
+                record(tm, order_cancelled, (team, tm, order_id))
             else:  # operation is "Hedge" or "Trade"
-                instrument = Instrument(int(row[4]))
+                instrument = _INSTRUMENTS[int(row[4])]
                 side = Side[row[5]]
                 volume = int(row[6])
                 price = float(row[7]) if operation == "Hedge" else int(row[7])
@@ -384,8 +441,7 @@ class RecordedEventSource(EventSource):
                 if operation == "Trade":
                     if order_id in orders[team] and orders[team][order_id].remaining_volume == 0:
                         del orders[team][order_id]
-                    events.append(Event(tm, source.trade_occurred.emit, (team, tm, order_id, side, volume, price,
-                                                                         fee)))
+                    record(tm, trade_occurred, (team, tm, order_id, side, volume, price, fee))
 
         take_snapshot(now)
         source.__end_time = now
@@ -396,7 +452,6 @@ class RecordedEventSource(EventSource):
         """Start this recorded event source."""
         self.__now = 0.0
         self._timer.start(TICK_INTERVAL_MILLISECONDS)
-        self.__event_iter = iter(self.__events)
-        self.__next_event = next(self.__event_iter, None)
+        self.__event_cursor = 0
         for competitor in sorted(self.__teams):
             self.login_occurred.emit(competitor)
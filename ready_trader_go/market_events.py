@@ -87,7 +87,7 @@ class MarketEventsReader(IOrderListener):
 
     def on_order_amended(self, now: float, order: Order, volume_removed: int) -> None:
         """Called when the order is amended."""
-        self.match_events.amend(now, "", order.client_order_id, -volume_removed)
+        self.match_events.amend(now, "", 0, order.client_order_id, -volume_removed)
         if order.remaining_volume == 0:
             if order.instrument == Instrument.FUTURE:
                 del self.future_orders[order.client_order_id]
@@ -96,7 +96,7 @@ class MarketEventsReader(IOrderListener):
 
     def on_order_cancelled(self, now: float, order: Order, volume_removed: int) -> None:
         """Called when the order is cancelled."""
-        self.match_events.cancel(now, "", order.client_order_id, -volume_removed)
+        self.match_events.cancel(now, "", 0, order.client_order_id, -volume_removed)
         if order.instrument == Instrument.FUTURE and order.client_order_id in self.future_orders:
             del self.future_orders[order.client_order_id]
         elif order.instrument == Instrument.ETF and order.client_order_id in self.etf_orders:
@@ -135,7 +135,7 @@ class MarketEventsReader(IOrderListener):
 
             if evt.operation == MarketEventOperation.INSERT:
                 order = Order(evt.order_id, evt.instrument, evt.lifespan, evt.side, evt.price, evt.volume, self)
-                self.match_events.insert(evt.time, "", order.client_order_id, order.instrument, order.side,
+                self.match_events.insert(evt.time, "", 0, order.client_order_id, order.instrument, order.side,
                                          abs(order.volume), order.price, order.lifespan)
                 book.insert(evt.time, order)
             elif evt.order_id in orders:
@@ -36,16 +36,17 @@ class MatchEventOperation(enum.IntEnum):
 
 
 class MatchEvent:
-    __slots__ = ("time", "competitor", "operation", "order_id", "instrument", "side", "volume", "price", "lifespan",
-                 "fee")
+    __slots__ = ("time", "competitor", "competitor_id", "operation", "order_id", "instrument", "side", "volume",
+                 "price", "lifespan", "fee")
 
     OPERATION_NAMES = {o: o.name.capitalize() for o in MatchEventOperation}
 
-    def __init__(self, time: float, competitor: str, operation: MatchEventOperation, order_id: int,
-                 instrument: Optional[Instrument], side: Optional[Side], volume: int,
+    def __init__(self, time: float, competitor: str, competitor_id: int, operation: MatchEventOperation,
+                 order_id: int, instrument: Optional[Instrument], side: Optional[Side], volume: int,
                  price: Optional[Union[int, float]], lifespan: Optional[Lifespan], fee: Optional[int]):
         self.time: float = time
         self.competitor: str = competitor
+        self.competitor_id: int = competitor_id
         self.operation: MatchEventOperation = operation
         self.order_id: int = order_id
         self.instrument: Optional[Instrument] = instrument
@@ -78,37 +79,39 @@ class MatchEvents:
         # Callbacks
         self.event_occurred: List[Callable[[MatchEvent], None]] = list()
 
-    def amend(self, now: float, name: str, order_id: int, diff: int) -> None:
+    def amend(self, now: float, name: str, identifier: int, order_id: int, diff: int) -> None:
         """Create a new amend event."""
-        event = MatchEvent(now, name, MatchEventOperation.AMEND, order_id, None, None, diff, None, None, None)
+        event = MatchEvent(now, name, identifier, MatchEventOperation.AMEND, order_id, None, None, diff, None, None,
+                           None)
         for callback in self.event_occurred:
             callback(event)
 
-    def cancel(self, now: float, name: str, order_id: int, diff: int) -> None:
+    def cancel(self, now: float, name: str, identifier: int, order_id: int, diff: int) -> None:
         """Create a new cancel event."""
-        event = MatchEvent(now, name, MatchEventOperation.CANCEL, order_id, None, None, diff, None, None, None)
+        event = MatchEvent(now, name, identifier, MatchEventOperation.CANCEL, order_id, None, None, diff, None, None,
+                           None)
         for callback in self.event_occurred:
             callback(event)
 
-    def fill(self, now: float, name: str, order_id: int, instrument: Instrument, side: Side, price: int, diff: int,
-             fee: int) -> None:
+    def fill(self, now: float, name: str, identifier: int, order_id: int, instrument: Instrument, side: Side,
+             price: int, diff: int, fee: int) -> None:
         """Create a new fill event."""
         for callback in self.event_occurred:
-            callback(MatchEvent(now, name, MatchEventOperation.TRADE, order_id, instrument, side, diff, price,
-                                None, fee))
+            callback(MatchEvent(now, name, identifier, MatchEventOperation.TRADE, order_id, instrument, side, diff,
+                                price, None, fee))
 
-    def hedge(self, now: float, name: str, order_id: int, instrument: Instrument, side: Side, price: float,
-              volume: int) -> None:
+    def hedge(self, now: float, name: str, identifier: int, order_id: int, instrument: Instrument, side: Side,
+              price: float, volume: int) -> None:
         """Create a new fill event."""
         for callback in self.event_occurred:
-            callback(MatchEvent(now, name, MatchEventOperation.HEDGE, order_id, instrument, side, volume, price,
-                                None, None))
+            callback(MatchEvent(now, name, identifier, MatchEventOperation.HEDGE, order_id, instrument, side, volume,
+                                price, None, None))
 
-    def insert(self, now: float, name: str, order_id: int, instrument: Instrument, side: Side, volume: int,
-               price: int, lifespan: Lifespan) -> None:
+    def insert(self, now: float, name: str, identifier: int, order_id: int, instrument: Instrument, side: Side,
+               volume: int, price: int, lifespan: Lifespan) -> None:
         """Create a new insert event."""
-        event = MatchEvent(now, name, MatchEventOperation.INSERT, order_id, instrument, side, volume, price,
-                           lifespan, None)
+        event = MatchEvent(now, name, identifier, MatchEventOperation.INSERT, order_id, instrument, side, volume,
+                           price, lifespan, None)
         for callback in self.event_occurred:
             callback(event)
 
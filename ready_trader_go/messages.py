@@ -75,6 +75,11 @@ TRADE_TICKS_MESSAGE = struct.Struct("!%dI" % (4 * order_book.TOP_LEVEL_COUNT))
 BOOK_PART = struct.Struct("!%dI" % order_book.TOP_LEVEL_COUNT)
 TICKS_PART = struct.Struct("!%dI" % order_book.TOP_LEVEL_COUNT)
 
+# Helpers for decoding an entire information message (header fields and all
+# four price/volume vectors) in a single call
+ORDER_BOOK_FULL_MESSAGE = struct.Struct("!BI%dI" % (4 * order_book.TOP_LEVEL_COUNT))
+TRADE_TICKS_FULL_MESSAGE = struct.Struct("!BI%dI" % (4 * order_book.TOP_LEVEL_COUNT))
+
 # Matching engine to HUD messages
 AMEND_EVENT_MESSAGE = struct.Struct("!dIIi")  # Time, team id, order id, volume delta
 CANCEL_EVENT_MESSAGE = struct.Struct("!dII")  # Time, team id, order id
@@ -109,16 +114,21 @@ TRADE_EVENT_MESSAGE_SIZE: int = HEADER.size + TRADE_EVENT_MESSAGE.size
 LOGIN_EVENT_MESSAGE_SIZE: int = HEADER.size + LOGIN_EVENT_MESSAGE.size
 
 
-class Connection(asyncio.Protocol):
+class Connection(asyncio.BufferedProtocol):
     """A stream-based network connection."""
 
+    __slots__ = ("_closing", "_file_number", "_connection_transport", "__buffer", "__read_off", "__write_off",
+                 "__logger")
+
     def __init__(self):
         """Initialize a new instance of the Connection class."""
         self._closing: bool = False
-        self._data: bytes = b""
         self._file_number: int = 0
         self._connection_transport: Optional[asyncio.Transport] = None
 
+        self.__buffer = bytearray(65536)
+        self.__read_off: int = 0
+        self.__write_off: int = 0
         self.__logger = logging.getLogger("CONNECTION")
 
     def close(self):
@@ -144,26 +154,64 @@ class Connection(asyncio.Protocol):
                            *(transport.get_extra_info("peername") or ("unknown", 0)))
         self._connection_transport = transport
 
-    def data_received(self, data: bytes) -> None:
-        """Called when data is received."""
-        if self._data:
-            self._data += data
-        else:
-            self._data = data
+    def get_buffer(self, sizehint: int) -> memoryview:
+        """Return a buffer for the transport to receive into."""
+        if len(self.__buffer) - self.__write_off < 4096:
+            self.__reserve()
+        return memoryview(self.__buffer)[self.__write_off:]
 
-        upto: int = 0
-        data_length: int = len(self._data)
+    def buffer_updated(self, nbytes: int) -> None:
+        """Called when the transport has received nbytes into the buffer."""
+        self.__write_off += nbytes
+        self.__parse()
 
-        while not self._closing and upto < data_length - HEADER_SIZE:
-            length, typ = HEADER.unpack_from(self._data, upto)
-            if upto + length > data_length:
+    def data_received(self, data: bytes) -> None:
+        """Called when data is received as a bytes object.
+
+        The transport normally receives straight into the buffer handed out
+        by get_buffer; this entry point remains for callers that deliver
+        ready-made bytes.
+        """
+        size: int = len(data)
+        if len(self.__buffer) - self.__write_off < size:
+            self.__reserve(size)
+        self.__buffer[self.__write_off:self.__write_off + size] = data
+        self.__write_off += size
+        self.__parse()
+
+    def __parse(self) -> None:
+        """Process any complete messages in the receive buffer."""
+        buffer = self.__buffer
+        read_off: int = self.__read_off
+        write_off: int = self.__write_off
+        header_unpack = HEADER.unpack_from
+        on_message = self.on_message
+
+        while not self._closing and write_off - read_off > HEADER_SIZE:
+            length, typ = header_unpack(buffer, read_off)
+            if read_off + length > write_off:
                 break
 
-            self.on_message(typ, self._data, upto + HEADER_SIZE, length)
+            on_message(typ, buffer, read_off + HEADER_SIZE, length)
 
-            upto += length
+            read_off += length
 
-        self._data = self._data[upto:]
+        if read_off == write_off:
+            self.__read_off = self.__write_off = 0
+        else:
+            self.__read_off = read_off
+
+    def __reserve(self, needed: int = 4096) -> None:
+        """Make room at the end of the receive buffer."""
+        buffer = self.__buffer
+        read_off: int = self.__read_off
+        if read_off:
+            # Reclaim the consumed prefix by moving the tail to the front
+            buffer[:self.__write_off - read_off] = buffer[read_off:self.__write_off]
+            self.__write_off -= read_off
+            self.__read_off = 0
+        while len(buffer) - self.__write_off < needed:
+            buffer.extend(bytes(len(buffer)))
 
     def on_message(self, typ: int, data: bytes, start: int, length: int) -> None:
         """Callback when an individual message has been received."""
@@ -29,6 +29,8 @@ TOP_LEVEL_COUNT = 5
 
 
 class IOrderListener(object):
+    __slots__ = ()
+
     def on_order_amended(self, now: float, order, volume_removed: int) -> None:
         """Called when the order is amended."""
         pass
@@ -131,6 +131,10 @@ class ScoreBoardWriter:
                         account.future_position, etf_price, future_price, account.total_fees, account.account_balance,
                         account.profit_or_loss, status))
 
+    def tick_batch(self, records: List[ScoreRecord]) -> None:
+        """Queue a batch of tick records produced in a single timer tick."""
+        self.queue.put(records)
+
     def writer(self, score_records_file: TextIO) -> None:
         """Fetch score records from a queue and write them to a file"""
         count = 0
@@ -145,8 +149,12 @@ class ScoreBoardWriter:
 
                 evt = fifo.get()
                 while evt is not None:
-                    count += 1
-                    csv_writer.writerow(evt)
+                    if type(evt) is list:
+                        count += len(evt)
+                        csv_writer.writerows(evt)
+                    else:
+                        count += 1
+                        csv_writer.writerow(evt)
                     evt = fifo.get()
         finally:
             if not self.event_loop.is_closed():
@@ -83,7 +83,7 @@ async def __start_autotrader(auto_trader: BaseAutoTrader, config: Dict[str, Any]
 
     exec_ = config["Execution"]
     try:
-        await loop.create_connection(lambda: auto_trader, exec_["Host"], exec_["Port"])
+        await loop.create_connection(auto_trader.execution_protocol, exec_["Host"], exec_["Port"])
     except OSError as e:
         logger.error("execution connection failed: %s", e.strerror)
         loop.stop()
@@ -91,7 +91,7 @@ async def __start_autotrader(auto_trader: BaseAutoTrader, config: Dict[str, Any]
 
     info = config["Information"]
     sub_factory = SubscriberFactory(info["Type"], info["Name"])
-    sub_factory.create(auto_trader)
+    sub_factory.create(auto_trader.information_protocol())
 
 
 def main(name: str = "autotrader") -> None:
@@ -44,6 +44,8 @@ class Lifespan(enum.IntEnum):
 
 
 class ICompetitor:
+    __slots__ = ()
+
     def disconnect(self, now: float) -> None:
         """Disconnect this competitor."""
         raise NotImplementedError()
@@ -67,12 +69,16 @@ class ICompetitor:
 
 
 class IController:
+    __slots__ = ()
+
     def advance_time(self):
         """Return the current time after accounting for events."""
         raise NotImplementedError()
 
 
 class IExecutionConnection:
+    __slots__ = ()
+
     def close(self):
         """Close the execution channel."""
         raise NotImplementedError()
@@ -8,6 +8,7 @@ UNHEDGED_LOTS_TIME_LIMIT: int = 600
 
 class UnhedgedLots:
     """Keep track of unhedged lots and call a callback if unhedged lots are held for too long."""
+    __slots__ = ("callback", "relative_position", "timer_handle")
 
     def __init__(self, callback: Callable[[], Any]):
         """Initialise a new instance of the UnhedgedLots class."""